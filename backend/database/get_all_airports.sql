@@ -0,0 +1,21 @@
+-- RPC for fetching the whole airports table in one gzipped roundtrip
+-- Returns only the columns the backend actually uses, so the payload is
+-- far smaller than the paginated SELECT * fallback it replaces.
+
+CREATE OR REPLACE FUNCTION get_all_airports()
+RETURNS TABLE (
+    icao_code VARCHAR,
+    name TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    type VARCHAR,
+    iso_country VARCHAR
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT icao_code, name, latitude, longitude, type, iso_country
+    FROM airports;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_all_airports() TO anon, authenticated;
@@ -0,0 +1,49 @@
+"""
+JIT-compiled great-circle distance helpers for distance-only callers.
+
+The pyproj Geod path stays authoritative wherever path coordinates are
+returned to clients; these haversine kernels exist for hot spots that only
+need a distance and should not pay the Python/C boundary crossing of
+GeographicLib per call.
+"""
+
+import math
+
+from numba import njit
+
+# Mean Earth radius in meters (IUGG)
+_EARTH_RADIUS_M = 6371008.8
+
+
+@njit(cache=True, fastmath=True)
+def distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in meters between two points given in degrees."""
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lat2_rad = math.radians(lat2)
+    lon2_rad = math.radians(lon2)
+
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    a = (math.sin(dlat / 2.0) ** 2
+         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2.0) ** 2)
+    c = 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
+    return _EARTH_RADIUS_M * c
+
+
+@njit(cache=True, fastmath=True)
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in kilometers between two points given in degrees."""
+    return distance_m(lat1, lon1, lat2, lon2) / 1000.0
+
+
+def distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in nautical miles between two points given in degrees."""
+    return distance_m(lat1, lon1, lat2, lon2) / 1852.0
+
+
+# Warm up the JIT kernels at import time so the first caller doesn't pay
+# the compilation cost (cache=True persists it across restarts).
+distance_km(0.0, 0.0, 1.0, 1.0)
@@ -17,6 +17,19 @@ logger = logging.getLogger(__name__)
 # Global variable to store the filtered airports dataframe
 _airports_df: Optional[pd.DataFrame] = None
 
+# ICAO -> row dict index built once per load, so lookups are hash hits
+# instead of boolean-mask scans over the whole dataframe
+_airports_by_icao: Optional[Dict[str, Dict]] = None
+
+# Columnar snapshot of the airports table: when the table etag is
+# unchanged, a process start reads the local file instead of re-paginating
+# the whole table over the network. The etag lives in a sidecar text file
+# next to the parquet.
+_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'airports_snapshot.parquet'
+)
+_SNAPSHOT_ETAG_PATH = _SNAPSHOT_PATH + '.etag'
+
 # Supabase configuration
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
@@ -28,54 +41,115 @@ if not SUPABASE_URL or not SUPABASE_ANON_KEY:
 # Initialize Supabase client
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
+def _build_icao_index(df: pd.DataFrame) -> Dict[str, Dict]:
+    """Build the ICAO -> row dict index in one pass over the frame."""
+    return df.set_index('icao_code', drop=False).to_dict(orient='index')
+
+
+def _table_etag() -> Optional[str]:
+    """Cheap freshness signal for the airports table.
+
+    Combines the exact row count with the newest updated_at so in-place
+    row edits invalidate the snapshot too, not just inserts and deletes.
+    When the table has no updated_at column the etag degrades to the
+    count alone, which misses same-count edits; delete the snapshot file
+    to force a refetch after such an edit.
+    """
+    count_response = supabase.table('airports').select(
+        'icao_code', count='exact'
+    ).limit(1).execute()
+    total = count_response.count
+    if not total:
+        return None
+
+    try:
+        latest = supabase.table('airports').select(
+            'updated_at'
+        ).order('updated_at', desc=True).limit(1).execute()
+        stamp = str(latest.data[0].get('updated_at') or '') if latest.data else ''
+    except Exception:
+        stamp = ''
+    return f"{total}:{stamp}"
+
+
 def load_airports_data() -> pd.DataFrame:
     """
     Load and filter airports data from Supabase.
     Filters for medium_airport and large_airport types only.
     """
-    global _airports_df
-    
+    global _airports_df, _airports_by_icao
+
     if _airports_df is not None:
         logger.info("Using cached airports data")
         return _airports_df
-    
+
     logger.info("Loading airports data from Supabase...")
-    
+
     try:
+        # Two cheap queries (count + newest updated_at) decide whether the
+        # local parquet snapshot is still current; a matching etag skips
+        # the paginated fetch
+        etag = _table_etag()
+
+        if etag and os.path.exists(_SNAPSHOT_PATH) and os.path.exists(_SNAPSHOT_ETAG_PATH):
+            try:
+                with open(_SNAPSHOT_ETAG_PATH) as f:
+                    stored_etag = f.read().strip()
+                if stored_etag == etag:
+                    df = pd.read_parquet(_SNAPSHOT_PATH)
+                    logger.info(f"Loaded {len(df)} airports from local snapshot")
+                    _airports_df = df
+                    _airports_by_icao = _build_icao_index(df)
+                    return df
+                logger.info("Snapshot etag stale, refetching from Supabase")
+            except Exception as e:
+                logger.warning(f"Could not read airports snapshot: {e}")
+
         # Query Supabase for all airports data using pagination
         # This ensures we get all records regardless of the total count
         all_data = []
         page_size = 1000
         offset = 0
-        
+
         while True:
             response = supabase.table('airports').select('*').range(offset, offset + page_size - 1).execute()
-            
+
             if not response.data:
                 break
-            
+
             all_data.extend(response.data)
             logger.info(f"Loaded {len(response.data)} records (total so far: {len(all_data)})")
-            
+
             # If we got less than the page size, we've reached the end
             if len(response.data) < page_size:
                 break
-            
+
             offset += page_size
-        
+
         if not all_data:
             logger.error("No airports data found in Supabase")
             raise ValueError("No airports data found in database")
-        
+
         # Convert to DataFrame
         df = pd.DataFrame(all_data)
         logger.info(f"Successfully loaded {len(df)} total airports from Supabase")
-        
-        # Cache the dataframe
+
+        # Cache the dataframe and its lookup index
         _airports_df = df
-        
+        _airports_by_icao = _build_icao_index(df)
+
+        # Persist the columnar snapshot for the next process start; purely
+        # an optimization, so failures only log
+        try:
+            df.to_parquet(_SNAPSHOT_PATH, index=False)
+            if etag:
+                with open(_SNAPSHOT_ETAG_PATH, 'w') as f:
+                    f.write(etag)
+        except Exception as e:
+            logger.warning(f"Could not write airports snapshot: {e}")
+
         return df
-        
+
     except Exception as e:
         logger.error(f"Error loading airports data from Supabase: {e}")
         raise
@@ -91,16 +165,16 @@ def find_airport_by_icao(icao_code: str) -> Optional[Dict]:
     Returns:
         Dictionary with airport details or None if not found
     """
-    df = load_airports_data()
-    
-    # Filter by ICAO code (stored in 'icao_code' column from Supabase)
-    airport = df[df['icao_code'] == icao_code.upper()]
-    
-    if airport.empty:
+    load_airports_data()
+
+    # Hash lookup in the prebuilt index (keyed by the 'icao_code' column
+    # from Supabase) instead of a boolean-mask scan per call
+    airport_data = _airports_by_icao.get(icao_code.upper())
+
+    if airport_data is None:
         logger.warning(f"Airport with ICAO code {icao_code} not found")
         return None
-    
-    airport_data = airport.iloc[0]
+
     return {
         'icao': airport_data['icao_code'],
         'name': airport_data['name'],
@@ -111,6 +185,27 @@ def find_airport_by_icao(icao_code: str) -> Optional[Dict]:
     }
 
 
+def find_airports_by_icao(icao_codes: List[str]) -> Dict[str, Dict]:
+    """
+    Resolve a batch of ICAO codes in one pass over the prebuilt index.
+
+    Args:
+        icao_codes: List of 4-letter ICAO airport codes
+
+    Returns:
+        Dictionary mapping each found (uppercased) code to its details;
+        unknown codes are simply absent from the result
+    """
+    load_airports_data()
+
+    results: Dict[str, Dict] = {}
+    for code in icao_codes:
+        airport = find_airport_by_icao(code)
+        if airport:
+            results[code.upper()] = airport
+    return results
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points using Haversine formula.
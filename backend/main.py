@@ -4,14 +4,26 @@ AviFlux Weather Summarizer App for Pilots
 Main FastAPI application with flight path summary functionality
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pydantic import BaseModel
 from typing import List, Tuple, Optional, Dict
+import asyncio
+import httpx
+import numpy as np
+import orjson
 import pandas as pd
 import os
+import pickle
+import sys
+import threading
 from dotenv import load_dotenv
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 import logging
 from pyproj import Geod
 
@@ -37,13 +49,26 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared WGS84 geodesic object: constructed once instead of per request
+_GEOD = Geod(ellps='WGS84')
+
+# On-disk snapshot of the airport lookup dicts for fast warm starts
+_AIRPORTS_SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airports_cache.pkl')
+
 # Initialize FastAPI app
 app = FastAPI(
-    title="AviFlux Weather Summarizer API", 
+    title="AviFlux Weather Summarizer API",
     version="1.0.0",
-    description="Aviation weather summarizer and flight path analysis for pilots"
+    description="Aviation weather summarizer and flight path analysis for pilots",
+    # orjson encodes the float-heavy coordinate payloads several times
+    # faster than stdlib json and handles numpy scalars natively
+    default_response_class=ORJSONResponse
 )
 
+# Gzip responses above 1 KiB: coordinate-heavy route payloads compress
+# 5-10x, and level 5 keeps CPU cost modest
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware for frontend integration
 app.add_middleware(
     CORSMiddleware,
@@ -89,8 +114,13 @@ class AirportDatabase:
     
     def __init__(self):
         """Initialize the airport database by loading data from Supabase."""
-        self._airports_df: Optional[pd.DataFrame] = None
-        self._icao_coords_map: Dict[str, Tuple[float, float]] = {}
+        # Coordinates live in one contiguous (N, 2) float64 array of
+        # [lat, lon] rows; the dict maps ICAO code to row index so scalar
+        # lookups stay O(1) while vectorized math can slice the array
+        self._coords: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        self._icao_to_row: Dict[str, int] = {}
+        self._icao_info_map: Dict[str, Dict] = {}
+        self._icao_keys: frozenset = frozenset()
         self._supabase_client = self._init_supabase()
         self._load_airports_data()
         
@@ -98,71 +128,215 @@ class AirportDatabase:
         """Initialize Supabase client with environment variables."""
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_anon_key = os.getenv("SUPABASE_ANON_KEY")
-        
+
         if not supabase_url or not supabase_anon_key:
             raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set in .env file")
-        
-        return create_client(supabase_url, supabase_anon_key)
+
+        # Kept for the direct PostgREST bulk fetch in _fetch_all_airports
+        self._supabase_url = supabase_url.rstrip('/')
+        self._supabase_anon_key = supabase_anon_key
+
+        # Explicit timeouts keep slow PostgREST calls from hanging workers;
+        # the underlying httpx client already pools keep-alive connections
+        # per instance, so reusing this singleton reuses warm TLS sessions
+        options = ClientOptions(
+            postgrest_client_timeout=30,
+            storage_client_timeout=30
+        )
+        return create_client(supabase_url, supabase_anon_key, options=options)
     
     def _load_airports_data(self):
         """Load airports data from Supabase and create ICAO to coordinates mapping."""
         logger.info("Loading airports data from Supabase...")
         
         try:
-            # Query Supabase for all airports data using pagination
-            all_data = []
+            # Query Supabase for all airports data using pagination. An
+            # exact-count query first lets all remaining pages be fetched
+            # in parallel instead of serially paying one RTT per page.
             page_size = 1000
-            offset = 0
-            
-            while True:
-                response = self._supabase_client.table('airports').select('*').range(offset, offset + page_size - 1).execute()
-                
-                if not response.data:
-                    break
-                
-                all_data.extend(response.data)
-                logger.info(f"Loaded {len(response.data)} records (total so far: {len(all_data)})")
-                
-                # If we got less than the page size, we've reached the end
-                if len(response.data) < page_size:
-                    break
-                
-                offset += page_size
-            
+
+            count_response = (
+                self._supabase_client.table('airports')
+                .select('*', count='exact')
+                .range(0, 0)
+                .execute()
+            )
+            total = count_response.count or 0
+
+            # Warm starts: reuse the on-disk snapshot when the table etag
+            # still matches, skipping the full table download entirely
+            etag = f"{total}:{self._max_updated_at()}"
+            if self._load_snapshot(etag):
+                return
+
+            all_data = self._fetch_all_airports(total, page_size)
+
             if not all_data:
                 logger.error("No airports data found in Supabase")
                 raise ValueError("No airports data found in database")
             
-            # Convert to DataFrame
-            self._airports_df = pd.DataFrame(all_data)
-            logger.info(f"Successfully loaded {len(self._airports_df)} total airports from Supabase")
-            
-            # Create ICAO to coordinates mapping
-            self._create_icao_coords_map()
-            
+            # Convert to a transient DataFrame: once the lookup dicts are
+            # built there is no reason to keep megabytes of rows resident
+            airports_df = pd.DataFrame(all_data)
+            logger.info(f"Successfully loaded {len(airports_df)} total airports from Supabase")
+
+            # Create ICAO to coordinates and info mappings
+            self._create_icao_coords_map(airports_df)
+            self._create_icao_info_map(all_data)
+
+            self._save_snapshot(etag)
+
         except Exception as e:
             logger.error(f"Error loading airports data from Supabase: {e}")
             raise
-    
-    def _create_icao_coords_map(self):
+
+    def _fetch_all_airports(self, total: int, page_size: int) -> List[Dict]:
+        """
+        Fetch every airport row, preferring the get_all_airports RPC.
+
+        The RPC (database/get_all_airports.sql) returns the whole table with
+        only the columns we use in one gzipped roundtrip; when it is not
+        deployed, fall back to parallel paginated fetches.
+        """
+        try:
+            response = self._supabase_client.rpc('get_all_airports').execute()
+            if response.data:
+                logger.info(f"Loaded {len(response.data)} records via get_all_airports RPC")
+                return response.data
+        except Exception as e:
+            logger.info(f"get_all_airports RPC unavailable ({e}), falling back to pagination")
+
+        # Hit PostgREST directly with a pooled httpx client and parse the
+        # raw bytes with orjson: one JSON parse per page instead of going
+        # through supabase-py's stdlib-json response pipeline
+        headers = {
+            'apikey': self._supabase_anon_key,
+            'Authorization': f"Bearer {self._supabase_anon_key}",
+            'Accept-Encoding': 'gzip',
+        }
+        with httpx.Client(
+            base_url=f"{self._supabase_url}/rest/v1",
+            headers=headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        ) as http:
+            def _fetch_page(offset: int) -> List[Dict]:
+                response = http.get(
+                    '/airports',
+                    params={'select': '*', 'offset': offset, 'limit': page_size}
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                logger.info(f"Loaded {len(data)} records (offset {offset})")
+                return data
+
+            offsets = list(range(0, total, page_size))
+            if len(offsets) <= 1:
+                return _fetch_page(0) if offsets else []
+
+            # Cap concurrency at 8 to respect Supabase rate limits;
+            # executor.map keeps pages in offset order.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                pages = list(executor.map(_fetch_page, offsets))
+            return [record for page in pages for record in page]
+
+    def _max_updated_at(self) -> str:
+        """Newest updated_at in the airports table, or '' when unavailable.
+
+        Part of the snapshot etag: it catches in-place row edits that the
+        row count alone cannot see. A table without the column degrades
+        to the count-only check (delete the snapshot file to force a
+        refetch after a same-count edit).
+        """
+        try:
+            response = (
+                self._supabase_client.table('airports')
+                .select('updated_at')
+                .order('updated_at', desc=True)
+                .limit(1)
+                .execute()
+            )
+            if response.data:
+                return str(response.data[0].get('updated_at') or '')
+        except Exception as e:
+            logger.info(f"updated_at unavailable for snapshot etag ({e})")
+        return ''
+
+    def _load_snapshot(self, expected_etag: str) -> bool:
+        """
+        Load the lookup dicts from the local snapshot if it is still fresh.
+
+        The etag (row count plus newest updated_at) from two cheap queries
+        decides freshness: when it matches the snapshot, a cold start
+        becomes a local file read instead of re-downloading the table.
+        """
+        if not os.path.exists(_AIRPORTS_SNAPSHOT):
+            return False
+        try:
+            with open(_AIRPORTS_SNAPSHOT, 'rb') as f:
+                snapshot = pickle.load(f)
+            if snapshot.get('etag') != expected_etag:
+                logger.info("Airports snapshot is stale, reloading from Supabase")
+                return False
+            self._coords = snapshot['coords']
+            self._icao_to_row = snapshot['icao_to_row']
+            self._icao_info_map = snapshot['info']
+            self._icao_keys = frozenset(self._icao_to_row)
+            logger.info(f"Loaded {len(self._icao_to_row)} airports from local snapshot")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not read airports snapshot: {e}")
+            return False
+
+    def _save_snapshot(self, etag: str):
+        """Persist the lookup dicts so the next start can skip the download."""
+        try:
+            with open(_AIRPORTS_SNAPSHOT, 'wb') as f:
+                pickle.dump(
+                    {'etag': etag, 'coords': self._coords,
+                     'icao_to_row': self._icao_to_row, 'info': self._icao_info_map},
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            logger.info(f"Saved airports snapshot to {_AIRPORTS_SNAPSHOT}")
+        except Exception as e:
+            logger.warning(f"Could not write airports snapshot: {e}")
+
+    def _create_icao_coords_map(self, airports_df: pd.DataFrame):
         """Create a dictionary mapping ICAO codes to (latitude, longitude) tuples."""
-        if self._airports_df is None:
-            raise ValueError("Airports data not loaded")
-        
         # Filter out rows with null ICAO codes or coordinates
-        valid_airports = self._airports_df.dropna(subset=['icao_code', 'latitude', 'longitude'])
-        
-        # Create the mapping
-        for _, airport in valid_airports.iterrows():
-            icao_code = str(airport['icao_code']).upper()
-            if icao_code and len(icao_code) == 4:  # Valid ICAO codes are 4 characters
-                self._icao_coords_map[icao_code] = (
-                    float(airport['latitude']),
-                    float(airport['longitude'])
-                )
-        
-        logger.info(f"Created ICAO coordinates mapping for {len(self._icao_coords_map)} airports")
-    
+        valid_airports = airports_df.dropna(subset=['icao_code', 'latitude', 'longitude'])
+
+        # Valid ICAO codes are 4 characters; build the index in one
+        # vectorized pass instead of boxing each row through iterrows()
+        codes = valid_airports['icao_code'].astype(str).str.upper()
+        mask = codes.str.len() == 4
+        lats = valid_airports.loc[mask, 'latitude'].to_numpy(dtype=np.float64)
+        lons = valid_airports.loc[mask, 'longitude'].to_numpy(dtype=np.float64)
+        self._coords = np.stack([lats, lons], axis=1)
+        self._icao_to_row = {code: row for row, code in enumerate(codes[mask].tolist())}
+        # Known-airport keyset for cheap existence checks before any
+        # geodesic math runs on a multi-leg request
+        self._icao_keys = frozenset(self._icao_to_row)
+
+        logger.info(f"Created ICAO coordinates mapping for {len(self._icao_to_row)} airports")
+
+    def _create_icao_info_map(self, all_data: List[Dict]):
+        """Create a dictionary mapping ICAO codes to airport info dicts."""
+        self._icao_info_map = {
+            rec['icao_code'].upper(): {
+                'icao': rec['icao_code'],
+                'name': rec.get('name'),
+                'latitude': float(rec['latitude']),
+                'longitude': float(rec['longitude']),
+                'type': rec.get('type', 'airport'),
+                'country': rec.get('iso_country', 'Unknown')
+            }
+            for rec in all_data
+            if rec.get('icao_code') and len(rec['icao_code']) == 4
+            and rec.get('latitude') is not None and rec.get('longitude') is not None
+        }
+        logger.info(f"Created ICAO info mapping for {len(self._icao_info_map)} airports")
+
     def get_coords(self, icao_code: str) -> Optional[Tuple[float, float]]:
         """
         Get coordinates for a given ICAO code.
@@ -173,7 +347,10 @@ class AirportDatabase:
         Returns:
             Tuple of (latitude, longitude) or None if not found
         """
-        return self._icao_coords_map.get(icao_code.upper())
+        row = self._icao_to_row.get(icao_code.upper())
+        if row is None:
+            return None
+        return (float(self._coords[row, 0]), float(self._coords[row, 1]))
     
     def get_airport_info(self, icao_code: str) -> Optional[Dict]:
         """
@@ -185,23 +362,7 @@ class AirportDatabase:
         Returns:
             Dictionary with airport details or None if not found
         """
-        if self._airports_df is None:
-            return None
-        
-        airport = self._airports_df[self._airports_df['icao_code'] == icao_code.upper()]
-        
-        if airport.empty:
-            return None
-        
-        airport_data = airport.iloc[0]
-        return {
-            'icao': airport_data['icao_code'],
-            'name': airport_data['name'],
-            'latitude': float(airport_data['latitude']),
-            'longitude': float(airport_data['longitude']),
-            'type': airport_data.get('type', 'airport'),
-            'country': airport_data.get('iso_country', 'Unknown')
-        }
+        return self._icao_info_map.get(icao_code.upper())
 
 
 # Pydantic Models
@@ -258,9 +419,9 @@ def calculate_flight_path(origin_icao: str, destination_icao: str) -> Dict:
     lat1, lon1 = origin_coords
     lat2, lon2 = destination_coords
     
-    # Create geodesic object (WGS84 ellipsoid)
-    geod = Geod(ellps='WGS84')
-    
+    # Shared WGS84 geodesic object (module-level; stateless, so safe to reuse)
+    geod = _GEOD
+
     # Calculate great circle path with 100 points
     num_points = 100
     path_points = geod.npts(lon1, lat1, lon2, lat2, npts=num_points-2)
@@ -285,6 +446,124 @@ def calculate_flight_path(origin_icao: str, destination_icao: str) -> Dict:
     }
 
 
+@lru_cache(maxsize=4096)
+def _path_summary_cached(origin_icao: str, destination_icao: str) -> PathSummaryResponse:
+    """
+    Cached core of the path summary endpoint.
+
+    Pure function of the (uppercased) ICAO pair: airport info lookups plus
+    deterministic geodesic math, so repeated popular routes return the same
+    immutable-in-practice response object from memory. Raises ValueError for
+    unknown airports (not cached; lru_cache does not memoize exceptions).
+    """
+    origin_info = airport_db.get_airport_info(origin_icao)
+    destination_info = airport_db.get_airport_info(destination_icao)
+
+    if not origin_info:
+        raise ValueError(f"Origin airport {origin_icao} not found")
+    if not destination_info:
+        raise ValueError(f"Destination airport {destination_icao} not found")
+
+    # Calculate flight path
+    path_data = calculate_flight_path(origin_icao, destination_icao)
+
+    # Extract first 3 and last 3 coordinates
+    coords = path_data['coordinates']
+    first_3_coords = coords[:3] if len(coords) >= 3 else coords
+    last_3_coords = coords[-3:] if len(coords) >= 3 else coords
+
+    return PathSummaryResponse(
+        origin_airport=f"{origin_info['name']} ({origin_icao})",
+        destination_airport=f"{destination_info['name']} ({destination_icao})",
+        distance_km=round(path_data['distance_km'], 2),
+        path_points_total=path_data['total_points'],
+        first_3_coords=first_3_coords,
+        last_3_coords=last_3_coords
+    )
+
+
+class _PathLookupFailed(Exception):
+    """Internal marker carrying a failed get_path_for_react payload."""
+
+    def __init__(self, result: Dict):
+        self.result = result
+
+
+@lru_cache(maxsize=4096)
+def _path_for_react_cached(origin_icao: str, destination_icao: str) -> Dict:
+    """
+    Cached core of the react path lookup.
+
+    get_path_for_react is deterministic per airport pair, but it reports
+    errors as {'success': False, ...} dicts rather than raising. Re-raise
+    those as _PathLookupFailed so transient failures (e.g. a database blip)
+    stay out of the cache (lru_cache does not memoize exceptions), matching
+    how _path_summary_cached handles unknown airports.
+    """
+    result = get_path_for_react(origin_icao, destination_icao)
+    if not result.get('success'):
+        raise _PathLookupFailed(result)
+    return result
+
+
+def _cached_path_for_react(origin_icao: str, destination_icao: str) -> Dict:
+    """Memoized get_path_for_react; only successful payloads are cached.
+
+    Callers must treat the returned dict as read-only.
+    """
+    try:
+        return _path_for_react_cached(origin_icao, destination_icao)
+    except _PathLookupFailed as failure:
+        return failure.result
+
+
+# Busiest (origin, destination) hub pairs; warmed into _path_summary_cached
+# at startup so the common requests are cache hits from the first call.
+# Replace with a top-N query against an analytics table once one exists.
+_TOP_SUMMARY_PAIRS = [
+    ("KJFK", "EGLL"), ("KJFK", "LFPG"), ("KJFK", "KLAX"), ("KJFK", "KSFO"),
+    ("KLAX", "RJTT"), ("KLAX", "KORD"), ("KSFO", "RJTT"), ("KATL", "KLAX"),
+    ("EGLL", "KORD"), ("EGLL", "OMDB"), ("EGLL", "VHHH"), ("EDDF", "KJFK"),
+    ("OMDB", "VHHH"), ("OMDB", "WSSS"), ("VIDP", "OMDB"), ("VABB", "VIDP"),
+    ("RJTT", "RKSI"), ("ZBAA", "RJTT"), ("WSSS", "YSSY"), ("KORD", "KSFO"),
+]
+
+
+def _warm_summary_cache() -> None:
+    """Prime the path summary cache for the busiest hub pairs."""
+    warmed = 0
+    for origin, destination in _TOP_SUMMARY_PAIRS:
+        try:
+            _path_summary_cached(origin, destination)
+            warmed += 1
+        except ValueError:
+            # Pair not present in this database snapshot; skip quietly
+            continue
+        except Exception as e:
+            logger.warning(f"Summary cache warmup failed for {origin}-{destination}: {e}")
+    logger.info(f"Warmed path summary cache for {warmed}/{len(_TOP_SUMMARY_PAIRS)} pairs")
+
+
+# Warm in the background so startup readiness is not delayed
+threading.Thread(target=_warm_summary_cache, name="summary-cache-warmup", daemon=True).start()
+
+
+@lru_cache(maxsize=16384)
+def _norm_icao(icao: str) -> Optional[str]:
+    """
+    Normalize and validate an ICAO code for the hot API paths.
+
+    Returns the interned uppercase form, or None if the code is not 4
+    characters. Interning lets downstream dict lookups short-circuit on
+    pointer identity, and the lru_cache skips re-allocating the uppercase
+    string for repeated codes.
+    """
+    normalized = icao.strip().upper()
+    if len(normalized) != 4:
+        return None
+    return sys.intern(normalized)
+
+
 # API Endpoints
 @app.get("/", tags=["root"])
 def read_root():
@@ -292,10 +571,31 @@ def read_root():
     return {"message": "AviFlux Weather Summarizer API is running"}
 
 
+# Liveness probes hit /api/health every few seconds for the life of the
+# pod; the payload only changes at startup, so serialize it once
+_HEALTH_JSON = orjson.dumps(
+    {"status": "healthy", "airports_loaded": len(airport_db._icao_to_row)}
+)
+
+
 @app.get("/api/health", tags=["health"])
 def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "airports_loaded": len(airport_db._icao_coords_map)}
+    """Health check endpoint (precomputed payload)."""
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+
+@app.post("/api/cache/clear", tags=["health"])
+def clear_path_caches():
+    """Clear the in-process path caches (e.g. after an airport data update)."""
+    summary_info = _path_summary_cached.cache_info()
+    path_info = _path_for_react_cached.cache_info()
+    _path_summary_cached.cache_clear()
+    _path_for_react_cached.cache_clear()
+    return {
+        "cleared": True,
+        "path_summary_entries": summary_info.currsize,
+        "react_path_entries": path_info.currsize
+    }
 
 
 @app.get("/api/debug/token", tags=["debug"])
@@ -338,51 +638,18 @@ def get_flight_path_summary(origin_icao: str, destination_icao: str):
     Raises:
         HTTPException: If airports are not found or invalid ICAO codes
     """
-    # Validate ICAO codes
-    if len(origin_icao) != 4 or len(destination_icao) != 4:
+    # Validate and normalize ICAO codes
+    origin_icao = _norm_icao(origin_icao)
+    destination_icao = _norm_icao(destination_icao)
+    if origin_icao is None or destination_icao is None:
         raise HTTPException(
             status_code=400,
             detail="ICAO codes must be exactly 4 characters long"
         )
-    
-    origin_icao = origin_icao.upper()
-    destination_icao = destination_icao.upper()
-    
+
     try:
-        # Get airport information
-        origin_info = airport_db.get_airport_info(origin_icao)
-        destination_info = airport_db.get_airport_info(destination_icao)
-        
-        if not origin_info:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Origin airport {origin_icao} not found"
-            )
-        
-        if not destination_info:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Destination airport {destination_icao} not found"
-            )
-        
-        # Calculate flight path
-        path_data = calculate_flight_path(origin_icao, destination_icao)
-        
-        # Extract first 3 and last 3 coordinates
-        coords = path_data['coordinates']
-        first_3_coords = coords[:3] if len(coords) >= 3 else coords
-        last_3_coords = coords[-3:] if len(coords) >= 3 else coords
-        
-        # Create response
-        response = PathSummaryResponse(
-            origin_airport=f"{origin_info['name']} ({origin_icao})",
-            destination_airport=f"{destination_info['name']} ({destination_icao})",
-            distance_km=round(path_data['distance_km'], 2),
-            path_points_total=path_data['total_points'],
-            first_3_coords=first_3_coords,
-            last_3_coords=last_3_coords
-        )
-        
+        response = _path_summary_cached(origin_icao, destination_icao)
+
         logger.info(f"Calculated path summary: {origin_icao} -> {destination_icao}, "
                    f"{response.distance_km} km, {response.path_points_total} points")
         
@@ -413,30 +680,44 @@ def get_multi_leg_route_summary(request: MultiLegRouteRequest):
     if len(icao_codes) < 2:
         raise HTTPException(status_code=400, detail="At least two airports required")
 
+    # Fail fast on unknown airports before any geodesic math runs
+    missing = [c for c in icao_codes if c not in airport_db._icao_keys]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Unknown airports: {', '.join(missing)}")
+
     try:
         data = route_service.calculate_multi_leg_route(icao_codes, circular=request.circular)
 
+        # model_construct: the route service already produced correctly
+        # typed values, so skip per-leg validation in the hot loop
         segments = [
-            RouteSegmentSummary(
-                origin=s['origin'],
-                destination=s['destination'],
-                distance_km=round(s['distance_km'], 2),
-                distance_nm=round(s['distance_nm'], 2),
-                points=s['points']
+            RouteSegmentSummary.model_construct(
+                origin=s.origin,
+                destination=s.destination,
+                distance_km=round(s.distance_km, 2),
+                distance_nm=round(s.distance_nm, 2),
+                points=s.points
             ) for s in data['segments']
         ]
 
-        return MultiLegRouteSummaryResponse(
+        coords = data['coordinates']
+        first_3 = coords[:3] if data['total_points'] >= 3 else coords
+        last_3 = coords[-3:] if data['total_points'] >= 3 else coords
+
+        # The server just computed these values, so skip re-validating them
+        # with model_construct and hand orjson the dump directly
+        response = MultiLegRouteSummaryResponse.model_construct(
             icao_codes=icao_codes,
             request_date=request.request_date,
             circular=request.circular,
             total_distance_km=round(data['distance_km'], 2),
             total_distance_nm=round(data['distance_nm'], 2),
             total_points=data['total_points'],
-            first_3_coords=data['coordinates'][:3] if data['total_points'] >= 3 else data['coordinates'],
-            last_3_coords=data['coordinates'][-3:] if data['total_points'] >= 3 else data['coordinates'],
+            first_3_coords=[list(c) for c in first_3],
+            last_3_coords=[list(c) for c in last_3],
             segments=segments
         )
+        return ORJSONResponse(content=response.model_dump(mode='json'))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -655,20 +936,19 @@ def get_flight_path(origin_icao: str, destination_icao: str):
     Raises:
         HTTPException: If airports are not found or calculation fails
     """
-    # Validate ICAO codes
-    if len(origin_icao) != 4 or len(destination_icao) != 4:
+    # Validate and normalize ICAO codes
+    origin_icao = _norm_icao(origin_icao)
+    destination_icao = _norm_icao(destination_icao)
+    if origin_icao is None or destination_icao is None:
         raise HTTPException(
             status_code=400,
             detail="ICAO codes must be exactly 4 characters long"
         )
-    
-    origin_icao = origin_icao.upper()
-    destination_icao = destination_icao.upper()
-    
+
     try:
-        # Use get_path functionality
-        result = get_path_for_react(origin_icao, destination_icao)
-        
+        # Use get_path functionality (cached per airport pair)
+        result = _cached_path_for_react(origin_icao, destination_icao)
+
         if result['success']:
             logger.info(f"Path calculated successfully: {origin_icao} -> {destination_icao}")
             return result
@@ -697,25 +977,28 @@ def get_flight_path_multi_icao(icao_codes: str):
     """
     try:
         # Parse comma-separated ICAO codes
-        airports = [icao.strip().upper() for icao in icao_codes.split(',')]
-        
+        raw_codes = icao_codes.split(',')
+
         # Validate minimum airports
-        if len(airports) < 2:
+        if len(raw_codes) < 2:
             raise HTTPException(status_code=400, detail="At least 2 airports required")
-        
-        if len(airports) > 10:
+
+        if len(raw_codes) > 10:
             raise HTTPException(status_code=400, detail="Maximum 10 airports allowed")
-        
-        # Validate ICAO codes
-        for icao in airports:
-            if len(icao) != 4:
-                raise HTTPException(status_code=400, detail=f"Invalid ICAO code: {icao}")
+
+        # Validate and normalize ICAO codes
+        airports = []
+        for icao in raw_codes:
+            normalized = _norm_icao(icao)
+            if normalized is None:
+                raise HTTPException(status_code=400, detail=f"Invalid ICAO code: {icao.strip()}")
+            airports.append(normalized)
         
         logger.info(f"Calculating multi-ICAO path: {' -> '.join(airports)}")
         
         # If only 2 airports, use simple path calculation
         if len(airports) == 2:
-            result = get_path_for_react(airports[0], airports[1])
+            result = _cached_path_for_react(airports[0], airports[1])
             if result['success']:
                 logger.info(f"Single path calculated successfully: {airports[0]} -> {airports[1]}")
                 return result
@@ -762,15 +1045,17 @@ def get_flight_path_simple(departure: str, arrival: str):
     Returns:
         Flight path data formatted for frontend
     """
-    # Validate ICAO codes
-    if len(departure) != 4 or len(arrival) != 4:
+    # Validate and normalize ICAO codes
+    departure = _norm_icao(departure)
+    arrival = _norm_icao(arrival)
+    if departure is None or arrival is None:
         raise HTTPException(status_code=400, detail="ICAO codes must be 4 characters long")
-    
+
     try:
         logger.info(f"Calculating simple path: {departure} -> {arrival}")
-        
-        # Use get_path functionality
-        result = get_path_for_react(departure, arrival)
+
+        # Use get_path functionality (cached per airport pair)
+        result = _cached_path_for_react(departure, arrival)
         
         if result['success']:
             logger.info(f"Path calculated successfully: {departure} -> {arrival}")
@@ -825,31 +1110,33 @@ def get_multi_leg_route(request: MultiLegRouteRequest):
         if data:
             logger.info(f"Multi-leg route calculated successfully for {len(request.icao_codes)} airports")
             
-            # Map service response to Pydantic model format
-            response_data = {
-                "icao_codes": request.icao_codes,
-                "request_date": request.request_date,
-                "circular": request.circular,
-                "total_distance_km": data.get('distance_km', 0.0),
-                "total_distance_nm": data.get('distance_nm', 0.0),
-                "total_points": data.get('total_points', 0),
-                "first_3_coords": data.get('coordinates', [])[:3] if data.get('coordinates') else [],
-                "last_3_coords": data.get('coordinates', [])[-3:] if data.get('coordinates') else [],
-                "segments": []  # Will be populated if segments exist in data
-            }
-            
-            # Add segments if they exist
-            if 'segments' in data:
-                for segment in data['segments']:
-                    response_data["segments"].append({
-                        "origin": segment.get('origin', ''),
-                        "destination": segment.get('destination', ''),
-                        "distance_km": segment.get('distance_km', 0.0),
-                        "distance_nm": segment.get('distance_nm', 0.0),
-                        "points": segment.get('points', 0)
-                    })
-            
-            return MultiLegRouteSummaryResponse(**response_data)
+            # Build the response with model_construct: the service output is
+            # already typed, so skip validating every segment and coordinate
+            coordinates = data.get('coordinates') or []
+            segments = [
+                RouteSegmentSummary.model_construct(
+                    origin=segment.origin,
+                    destination=segment.destination,
+                    distance_km=segment.distance_km,
+                    distance_nm=segment.distance_nm,
+                    points=segment.points
+                ) for segment in data.get('segments', [])
+            ]
+
+            response = MultiLegRouteSummaryResponse.model_construct(
+                icao_codes=request.icao_codes,
+                request_date=request.request_date,
+                circular=request.circular,
+                total_distance_km=data.get('distance_km', 0.0),
+                total_distance_nm=data.get('distance_nm', 0.0),
+                total_points=data.get('total_points', 0),
+                first_3_coords=[list(c) for c in coordinates[:3]],
+                last_3_coords=[list(c) for c in coordinates[-3:]],
+                segments=segments
+            )
+            # Return pre-dumped content so FastAPI doesn't re-validate the
+            # whole payload against response_model on the way out
+            return ORJSONResponse(content=response.model_dump(mode='json'))
         else:
             logger.error("Multi-leg route calculation returned no data")
             raise HTTPException(status_code=500, detail="Route calculation failed")
@@ -1087,22 +1374,30 @@ async def generate_and_save_flight_plan(
             "generated_at": flight_plan.generated_at.isoformat()
         }
         
-        # Save to database
-        save_result = await flight_plans_db_service.create_flight_plan(
-            route_details=route_details,
-            weather_summary=weather_summary,
-            risk_analysis=risk_analysis,
-            map_layers=map_layers,
-            chart_data=chart_data,
-            user_id=user_id
+        # Run the database write and the response payload build
+        # concurrently; the model_dump of a full flight plan is not free
+        # and is independent of the save result. to_thread gives the
+        # synchronous dump its own thread so the insert coroutine actually
+        # makes progress while it runs, and gather ties their lifetimes
+        # together (no orphaned insert if the dump raises).
+        save_result, flight_plan_payload = await asyncio.gather(
+            flight_plans_db_service.create_flight_plan(
+                route_details=route_details,
+                weather_summary=weather_summary,
+                risk_analysis=risk_analysis,
+                map_layers=map_layers,
+                chart_data=chart_data,
+                user_id=user_id
+            ),
+            asyncio.to_thread(flight_plan.model_dump),
         )
-        
+
         if save_result.success and save_result.data:
             return {
                 "success": True,
                 "message": "Flight plan generated and saved successfully",
                 "data": {
-                    "flight_plan": flight_plan.model_dump(),
+                    "flight_plan": flight_plan_payload,
                     "database_record": flight_plans_db_service.format_for_frontend(save_result.data)
                 }
             }
@@ -1112,7 +1407,7 @@ async def generate_and_save_flight_plan(
                 "success": False,
                 "message": "Flight plan generated but failed to save to database",
                 "data": {
-                    "flight_plan": flight_plan.model_dump(),
+                    "flight_plan": flight_plan_payload,
                     "save_error": save_result.error
                 }
             }
@@ -2,8 +2,8 @@
 Data Transfer Objects (DTOs) for API requests and responses
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Tuple, Dict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Optional, List, Dict
 from datetime import datetime
 from .flight_plan import FlightPlan
 
@@ -14,14 +14,15 @@ class FlightPlanRequest(BaseModel):
     destination_icao: str = Field(..., min_length=4, max_length=4, description="Destination airport ICAO code")
     departure_time: Optional[datetime] = Field(None, description="Planned departure time (optional)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "origin_icao": "KJFK",
                 "destination_icao": "KSFO",
                 "departure_time": "2025-09-25T12:00:00Z"
             }
         }
+    )
 
 
 class FlightPlanResponse(BaseModel):
@@ -31,8 +32,8 @@ class FlightPlanResponse(BaseModel):
     data: Optional[FlightPlan] = Field(None, description="Flight plan data if successful")
     error: Optional[str] = Field(None, description="Error message if unsuccessful")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Flight plan generated successfully",
@@ -43,6 +44,7 @@ class FlightPlanResponse(BaseModel):
                 "error": None
             }
         }
+    )
 
 
 # Multi-leg route DTOs
@@ -52,26 +54,28 @@ class MultiLegRouteRequest(BaseModel):
     request_date: Optional[datetime] = Field(None, description="Request timestamp (optional)")
     circular: bool = Field(False, description="If true, end leg returns to the source airport")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "icao_codes": ["KJFK", "KLAX", "EGLL", "EDDF", "RJTT"],
                 "request_date": "2025-09-26T12:00:00Z",
                 "circular": False
             }
         }
+    )
 
 
 class SimpleMultiLegRequest(BaseModel):
     """Simplified request for just ICAO codes"""
     icao_codes: List[str] = Field(..., min_length=2, description="Ordered ICAO list")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "icao_codes": ["KJFK", "KLAX", "EGLL", "EDDF", "RJTT"]
             }
         }
+    )
 
 
 # Flight Plans Database DTOs
@@ -84,8 +88,8 @@ class CreateFlightPlanRequest(BaseModel):
     chart_data: Dict = Field(..., description="JSONB charts and graphs data")
     user_id: Optional[str] = Field(None, description="User identifier")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "route_details": {
                     "origin": "KJFK",
@@ -110,6 +114,7 @@ class CreateFlightPlanRequest(BaseModel):
                 "user_id": "user-123"
             }
         }
+    )
 
 
 class FlightPlanSearchRequest(BaseModel):
@@ -120,8 +125,8 @@ class FlightPlanSearchRequest(BaseModel):
     limit: int = Field(50, description="Maximum results to return")
     offset: int = Field(0, description="Number of records to skip")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user-123",
                 "date_from": "2025-09-01T00:00:00Z",
@@ -130,6 +135,7 @@ class FlightPlanSearchRequest(BaseModel):
                 "offset": 0
             }
         }
+    )
 
 
 class MultiICAOFlightPlanRequest(BaseModel):
@@ -139,8 +145,8 @@ class MultiICAOFlightPlanRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="User identifier (optional)")
     circular: bool = Field(False, description="If true, return to the first airport")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "icao_codes": ["KJFK", "KLAX", "EGLL", "EDDF"],
                 "departure_time": "2025-09-26T12:00:00Z",
@@ -148,10 +154,16 @@ class MultiICAOFlightPlanRequest(BaseModel):
                 "circular": False
             }
         }
+    )
 
 
 class RouteSegmentSummary(BaseModel):
     """Per-leg summary between two consecutive airports"""
+    # Frozen, closed model: long routes build one instance per leg, and the
+    # frozen config lets pydantic-core use a leaner immutable layout with no
+    # assignment-validation machinery
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     origin: str
     destination: str
     distance_km: float
@@ -167,8 +179,10 @@ class MultiLegRouteSummaryResponse(BaseModel):
     total_distance_km: float
     total_distance_nm: float
     total_points: int
-    first_3_coords: List[Tuple[float, float]]
-    last_3_coords: List[Tuple[float, float]]
+    # Lists rather than tuples: orjson serializes lists directly without a
+    # tuple-to-list conversion hop on the float-heavy coordinate pairs
+    first_3_coords: List[List[float]]
+    last_3_coords: List[List[float]]
     segments: List[RouteSegmentSummary]
 
 
@@ -183,8 +197,8 @@ class WeatherBriefingRequest(BaseModel):
     enable_flight_monitoring: bool = Field(default=False, description="Enable real-time monitoring")
     flight_id: Optional[str] = Field(None, description="Optional flight identifier for monitoring")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "route_type": "single",
                 "airports": ["KJFK", "KLAX"],
@@ -195,6 +209,7 @@ class WeatherBriefingRequest(BaseModel):
                 "flight_id": "FL001"
             }
         }
+    )
 
 
 class WeatherData(BaseModel):
@@ -263,8 +278,8 @@ class WeatherBriefingResponse(BaseModel):
     last_updated: datetime
     valid_until: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Weather briefing generated successfully",
@@ -284,4 +299,13 @@ class WeatherBriefingResponse(BaseModel):
                 "flight_monitoring_enabled": False
             }
         }
+    )
+
 
+# Pre-compiled validators for the hot request bodies. FastAPI builds its
+# own per-route core validators at startup, so these exist for callers
+# outside the routing layer (services, scripts) that would otherwise pay
+# a fresh schema walk per Model(**data) validation.
+FLIGHT_PLAN_REQUEST_ADAPTER = TypeAdapter(FlightPlanRequest)
+MULTI_LEG_ROUTE_REQUEST_ADAPTER = TypeAdapter(MultiLegRouteRequest)
+MULTI_ICAO_FLIGHT_PLAN_REQUEST_ADAPTER = TypeAdapter(MultiICAOFlightPlanRequest)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Run the API test scripts concurrently against a live server.
+
+The scripts are independent, so running them in parallel subprocesses
+collapses wall time to the slowest script instead of the sum of both.
+Each script's output is captured and printed as one block, keeping the
+reports readable.
+"""
+
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+TEST_SCRIPTS = [
+    "test_endpoints.py",
+    "test_flight_plans_api.py",
+    "test_multi_icao_flightplan.py",
+]
+
+
+def _run_script(script: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(
+        [sys.executable, script],
+        capture_output=True,
+        text=True,
+    )
+
+
+def main() -> int:
+    print(f"Running {len(TEST_SCRIPTS)} test scripts in parallel...")
+
+    with ThreadPoolExecutor(max_workers=len(TEST_SCRIPTS)) as executor:
+        results = list(executor.map(_run_script, TEST_SCRIPTS))
+
+    exit_code = 0
+    for script, result in zip(TEST_SCRIPTS, results):
+        print(f"\n{'=' * 60}\n{script} (exit {result.returncode})\n{'=' * 60}")
+        sys.stdout.write(result.stdout)
+        if result.stderr:
+            sys.stderr.write(result.stderr)
+        if result.returncode != 0:
+            exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,129 @@
-import pandas as pd
+import functools
+import os
+import sys
+from typing import Dict, List
+
+import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 
 # The same URL for the comprehensive dataset
 AIRPORTS_CSV_URL = "https://davidmegginson.github.io/ourairports-data/airports.csv"
 
-# Load the entire dataset without any filters first
-print("Loading the full dataset for inspection...")
-df = pd.read_csv(AIRPORTS_CSV_URL)
+# Local cache for the ~8 MB feed, keyed by the server's ETag so a process
+# start only re-downloads when the upstream file actually changed
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aviflux")
+_CACHE_CSV = os.path.join(_CACHE_DIR, "airports.csv")
+_CACHE_ETAG = os.path.join(_CACHE_DIR, "airports.csv.etag")
+
+
+def _fetch_airports_csv() -> str:
+    """Return a local path to the airports CSV, re-downloading only on ETag change."""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+
+    cached_etag = None
+    if os.path.exists(_CACHE_CSV) and os.path.exists(_CACHE_ETAG):
+        with open(_CACHE_ETAG) as f:
+            cached_etag = f.read().strip()
+
+    with httpx.Client(follow_redirects=True, timeout=30.0) as client:
+        if cached_etag:
+            head = client.head(AIRPORTS_CSV_URL)
+            if head.headers.get("etag") == cached_etag:
+                print("Using cached airports.csv (ETag unchanged)")
+                return _CACHE_CSV
+
+        print("Downloading airports.csv...")
+        with client.stream("GET", AIRPORTS_CSV_URL) as response:
+            response.raise_for_status()
+            with open(_CACHE_CSV, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=8 * 1024 * 1024):
+                    f.write(chunk)
+            etag = response.headers.get("etag")
+        if etag:
+            with open(_CACHE_ETAG, "w") as f:
+                f.write(etag)
+
+    return _CACHE_CSV
+
+
+@functools.cache
+def get_airports() -> pa.Table:
+    """
+    Load the airports table lazily, once per process.
+
+    Nothing happens at import time, so workers that merely import this
+    module (or unit tests) don't pay the download and parse; the first
+    caller does, and every later call returns the cached table.
+
+    Only the columns we actually inspect are parsed: projecting 3 of ~50
+    columns keeps parse time and peak memory ~10x lower. 'type' is
+    dictionary-encoded since it only has a handful of distinct values.
+    """
+    convert_options = pacsv.ConvertOptions(
+        include_columns=['ident', 'name', 'type'],
+        column_types={
+            'ident': pa.string(),
+            'type': pa.dictionary(pa.int32(), pa.string()),
+        },
+    )
+    # Reading from the local file lets pyarrow mmap it instead of
+    # buffering the HTTP body in memory
+    return pacsv.read_csv(_fetch_airports_csv(), convert_options=convert_options)
+
+
+@functools.cache
+def get_ident_index() -> Dict[str, int]:
+    """
+    Ident-to-row index for O(1) point lookups.
+
+    Built once per process; replaces the O(N) column scan plus
+    boolean-mask allocation a filter per query would cost.
+    """
+    tbl = get_airports()
+    return dict(zip(tbl['ident'].to_pylist(), range(tbl.num_rows)))
+
+
+def lookup_idents(codes: List[str]) -> pa.Table:
+    """
+    Resolve a batch of ident codes to their rows in one vectorized pass.
+
+    pc.index_in hashes the whole query batch in C, and take gathers the
+    matching rows, so resolving the ~5 codes of a multi-leg request costs
+    one kernel call instead of a Python-level lookup per code. Unknown
+    codes yield null indices and are dropped before the gather.
+    """
+    tbl = get_airports()
+    idx = pc.index_in(pa.array(codes, type=pa.string()), tbl['ident'])
+    return tbl.take(idx.drop_null())
+
+
+def _inspect() -> None:
+    """Print the verification steps for the airports dataset."""
+    print("Loading the dataset for inspection (projected columns only)...")
+    tbl = get_airports()
+
+    # --- Verification Step 1: See all unique airport types ---
+    # Work on the dictionary-encoded Arrow column directly: unique() is an
+    # O(#categories) dictionary read and value_counts hashes int32 indices
+    # instead of rehashing ~80k Python strings
+    print("\nUnique values in the 'type' column:")
+    print(pc.unique(tbl['type']).to_pylist())
+
+    # --- Verification Step 2: Count how many of each type exist ---
+    # Format the counts in one write instead of a per-row repr/print cycle
+    print("\nCounts for each airport type:")
+    vc = pc.value_counts(tbl['type']).to_pylist()
+    sys.stdout.write('\n'.join(f"{row['values']}\t{row['counts']}" for row in vc) + '\n')
 
-# --- Verification Step 1: See all unique airport types ---
-print("\nUnique values in the 'type' column:")
-print(df['type'].unique())
+    # --- Verification Step 3: Find a specific large airport (Bengaluru) ---
+    # Slice the Arrow table directly: one row materializes as a plain dict,
+    # without converting the whole table to a DataFrame first
+    print("\nSearching for Bengaluru's Kempegowda International Airport (VOBL)...")
+    bengaluru_airport = tbl.slice(get_ident_index()['VIDP'], 1).to_pylist()[0]
+    print(bengaluru_airport)
 
-# --- Verification Step 2: Count how many of each type exist ---
-print("\nCounts for each airport type:")
-print(df['type'].value_counts())
 
-# --- Verification Step 3: Find a specific large airport (Bengaluru) ---
-print("\nSearching for Bengaluru's Kempegowda International Airport (VOBL)...")
-bengaluru_airport = df[df['ident'] == 'VIDP']
-print(bengaluru_airport[['ident', 'name', 'type']])
\ No newline at end of file
+if __name__ == "__main__":
+    _inspect()
@@ -3,21 +3,44 @@ Route calculation and management service
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from pyproj import Geod
 from datetime import datetime
+import geodesic_fast
 from models.flight_plan import RouteGeometry, AirportInfo
 
 logger = logging.getLogger(__name__)
 
+# Shared WGS84 geodesic object: building the ellipsoid is not free and the
+# object is stateless, so one instance serves every RouteService and caller
+_GEOD = Geod(ellps='WGS84')
+
+
+@dataclass(slots=True, frozen=True)
+class LegSummary:
+    """Internal per-leg summary built in the multi-leg hot loop.
+
+    A slotted frozen dataclass instead of a dict or Pydantic model: no
+    per-instance __dict__, no validation, and attribute access in the
+    handlers stays typo-safe. orjson and FastAPI's encoder both serialize
+    dataclasses directly, so it can also flow straight into responses.
+    """
+    origin: str
+    destination: str
+    distance_km: float
+    distance_nm: float
+    points: int
+
 
 class RouteService:
     """Service for route calculations and management"""
-    
+
     def __init__(self, airport_db):
         """Initialize with airport database"""
         self.airport_db = airport_db
-        self.geod = Geod(ellps='WGS84')
+        self.geod = _GEOD
     
     def calculate_great_circle_route(self, origin_icao: str, destination_icao: str, 
                                    num_points: int = 100) -> Dict:
@@ -102,7 +125,8 @@ class RouteService:
             num_points_per_leg: Points per leg including endpoints
 
         Returns:
-            Dictionary with combined coordinates, distance and per-segment summaries
+            Dictionary with combined coordinates, distance and per-leg
+            LegSummary instances under 'segments'
         """
         if len(airports) < 2:
             raise ValueError("At least two airports are required")
@@ -113,28 +137,61 @@ class RouteService:
         if circular:
             legs.append((airports[-1], airports[0]))
 
-        all_coords: List[Tuple[float, float]] = []
-        total_distance_meters: float = 0.0
-        segments: List[Dict] = []
+        # Resolve every airport exactly once, then batch all leg distances
+        # through a single geod.inv call over contiguous arrays so the
+        # geodesic math runs in one C loop instead of one call per leg
+        airport_coords: List[Tuple[float, float]] = []
+        for icao in airports:
+            coords = self.airport_db.get_coords(icao)
+            if not coords:
+                raise ValueError(f"Airport {icao} not found")
+            airport_coords.append(coords)
+
+        coords_arr = np.asarray(airport_coords, dtype=np.float64)
+        if circular:
+            coords_arr = np.vstack([coords_arr, coords_arr[:1]])
+
+        lats1, lons1 = coords_arr[:-1, 0], coords_arr[:-1, 1]
+        lats2, lons2 = coords_arr[1:, 0], coords_arr[1:, 1]
+        _, _, leg_distances = self.geod.inv(lons1, lats1, lons2, lats2)
+        total_distance_meters = float(np.sum(leg_distances))
+
+        # Assemble each leg in a preallocated (points, 2) array and join
+        # them with one concatenate, so the combined path is built from
+        # numpy slices instead of per-point tuple lists
+        leg_arrays: List[np.ndarray] = []
+        segments: List[LegSummary] = []
 
         for index, (origin, dest) in enumerate(legs):
-            segment = self.calculate_great_circle_route(origin, dest, num_points=num_points_per_leg)
+            lat1, lon1 = coords_arr[index]
+            lat2, lon2 = coords_arr[index + 1]
+
+            # Per-leg intermediate points (npts stays scalar; inv dominates)
+            path_points = self.geod.npts(lon1, lat1, lon2, lat2, npts=num_points_per_leg - 2)
+
+            leg = np.empty((len(path_points) + 2, 2), dtype=np.float64)
+            leg[0, 0], leg[0, 1] = lat1, lon1
+            if path_points:
+                # npts yields (lon, lat); store as [lat, lon] rows
+                mid = np.asarray(path_points, dtype=np.float64)
+                leg[1:-1, 0] = mid[:, 1]
+                leg[1:-1, 1] = mid[:, 0]
+            leg[-1, 0], leg[-1, 1] = lat2, lon2
 
             # Merge coordinates, avoid duplicating the start of subsequent legs
-            if index == 0:
-                all_coords.extend(segment['coordinates'])
-            else:
-                all_coords.extend(segment['coordinates'][1:])
+            leg_arrays.append(leg if index == 0 else leg[1:])
 
-            total_distance_meters += segment['distance_km'] * 1000.0
+            distance_meters = float(leg_distances[index])
+            segments.append(LegSummary(
+                origin=origin,
+                destination=dest,
+                distance_km=distance_meters / 1000.0,
+                distance_nm=distance_meters / 1852.0,
+                points=leg.shape[0]
+            ))
 
-            segments.append({
-                'origin': origin,
-                'destination': dest,
-                'distance_km': segment['distance_km'],
-                'distance_nm': segment['distance_nm'],
-                'points': segment['total_points']
-            })
+        path = np.concatenate(leg_arrays, axis=0)
+        all_coords: List[Tuple[float, float]] = [tuple(c) for c in path.tolist()]
 
         first_3 = all_coords[:3] if len(all_coords) >= 3 else all_coords
         last_3 = all_coords[-3:] if len(all_coords) >= 3 else all_coords
@@ -220,14 +277,27 @@ class RouteService:
         """
         # This is a simplified implementation
         # In a real system, you would use airways, navigation aids, etc.
-        
-        route_data = self.calculate_great_circle_route(origin_icao, destination_icao)
-        
+
+        origin_coords = self.airport_db.get_coords(origin_icao)
+        destination_coords = self.airport_db.get_coords(destination_icao)
+
+        if not origin_coords:
+            raise ValueError(f"Origin airport {origin_icao} not found")
+        if not destination_coords:
+            raise ValueError(f"Destination airport {destination_icao} not found")
+
+        # Only the distance matters here, so use the JIT haversine kernel
+        # instead of generating a full great-circle path
+        distance_nm = geodesic_fast.distance_nm(
+            origin_coords[0], origin_coords[1],
+            destination_coords[0], destination_coords[1]
+        )
+
         # For very long routes (>1000nm), suggest intermediate airports
-        if route_data['distance_nm'] > 1000:
+        if distance_nm > 1000:
             # This would typically involve complex logic to find suitable airports
             # For now, we'll return an empty list
-            logger.info(f"Long route detected ({route_data['distance_nm']:.0f}nm), "
+            logger.info(f"Long route detected ({distance_nm:.0f}nm), "
                        f"intermediate waypoints recommended")
-        
+
         return []  # Simplified - would implement waypoint logic here
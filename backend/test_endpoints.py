@@ -0,0 +1,65 @@
+"""
+Quick smoke test for the main API endpoints.
+
+Independent requests are issued concurrently with asyncio.gather over one
+pooled httpx.AsyncClient, so the wall time is roughly max(RTT) across the
+batch instead of the sum of every endpoint's round-trip.
+"""
+
+import asyncio
+import sys
+
+import httpx
+import orjson
+
+BASE_URL = "http://localhost:8000"
+ORIGIN = "KJFK"
+DEST = "KLAX"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# The POST bodies are fully static, so encode them to bytes once at import;
+# the request path just sends the constant instead of re-serializing a dict
+# (any future datetime fields should be passed as datetime objects and
+# encoded with orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z, not isoformat()+"Z")
+_BODY_SUMMARY_ROUTE = orjson.dumps({"icao_codes": [ORIGIN, DEST], "circular": False})
+_BODY_MULTI_LEG = orjson.dumps({"icao_codes": [ORIGIN, "EGLL", DEST]})
+
+
+async def run_tests() -> None:
+    # Collect the report lines and flush them with one stdout write at the
+    # end, instead of a lock-and-flush cycle per print
+    log = []
+    limits = httpx.Limits(max_keepalive_connections=16)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0, limits=limits) as client:
+        # Independent GETs: one gather, shared keep-alive connections
+        get_responses = await asyncio.gather(
+            client.get("/"),
+            client.get("/api/health"),
+            client.get(f"/api/flightpath/summary/{ORIGIN}/{DEST}"),
+            client.get(f"/api/path/{ORIGIN}/{DEST}"),
+        )
+        for response in get_responses:
+            log.append(f"GET {response.request.url.path}: {response.status_code}")
+
+        # The POSTs depend on nothing above, so batch them the same way
+        post_responses = await asyncio.gather(
+            client.post(
+                "/api/flightpath/summary/route",
+                content=_BODY_SUMMARY_ROUTE,
+                headers=_JSON_HEADERS
+            ),
+            client.post(
+                "/api/route/multi-leg",
+                content=_BODY_MULTI_LEG,
+                headers=_JSON_HEADERS
+            ),
+        )
+        for response in post_responses:
+            log.append(f"POST {response.request.url.path}: {response.status_code}")
+
+    sys.stdout.write('\n'.join(log) + '\n')
+
+
+if __name__ == "__main__":
+    asyncio.run(run_tests())
@@ -0,0 +1,63 @@
+"""
+Arrow IPC-backed example payloads for the API test scripts.
+
+The static parts of the flight-plan payloads live in one `.arrow` file
+that is generated on first use and then memory-mapped on every later
+load: zero-parse, shared read-only across parallel test processes, and
+no pandas/CSV machinery in the test startup path. Dynamic fields (run
+timestamps) stay out of the fixture and are injected at call time.
+"""
+
+import functools
+import os
+from typing import Dict, List
+
+import pyarrow as pa
+
+_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+_FIXTURE_PATH = os.path.join(_FIXTURE_DIR, "flight_plan_examples.arrow")
+
+# Source of truth for the fixture content; the .arrow file is just its
+# pre-parsed on-disk form and is regenerated whenever it is missing
+_FLIGHT_PLAN_EXAMPLES = [
+    {
+        "route_details": {
+            "origin": "KJFK",
+            "destination": "KLAX",
+            "distance_nm": 2144.5,
+            "estimated_time_min": 360
+        },
+        "weather_summary": {
+            "summary_text": ["Clear skies", "Light winds"],
+            "risk_index": "green"
+        },
+        "risk_analysis": {
+            "risks": [],
+            "overall_risk": "low"
+        },
+        "map_layers": {
+            "route_coordinates": [
+                [-73.7781, 40.6413],
+                [-118.4081, 33.9425]
+            ]
+        },
+        "user_id": "test-user-123"
+    }
+]
+
+
+def _write_fixture() -> None:
+    os.makedirs(_FIXTURE_DIR, exist_ok=True)
+    table = pa.Table.from_pylist(_FLIGHT_PLAN_EXAMPLES)
+    with pa.OSFile(_FIXTURE_PATH, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+@functools.cache
+def load_flight_plan_examples() -> List[Dict]:
+    """Return the example payloads, materializing the fixture on first use."""
+    if not os.path.exists(_FIXTURE_PATH):
+        _write_fixture()
+    with pa.memory_map(_FIXTURE_PATH) as source:
+        return pa.ipc.open_file(source).read_all().to_pylist()
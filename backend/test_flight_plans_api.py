@@ -3,50 +3,46 @@
 Test script for Flight Plans Database API endpoints
 """
 
-import requests
-import json
+import atexit
 from datetime import datetime
 
+import httpx
+import orjson
+
+from test_fixtures import load_flight_plan_examples
+
 BASE_URL = "http://localhost:8000"
 
+# One pooled client for the whole suite: keep-alive reuses the TCP
+# connection across tests instead of paying a fresh handshake per call
+_client = httpx.Client(base_url=BASE_URL, timeout=30.0)
+atexit.register(_client.close)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static payloads are serialized once at import; the requests just send
+# the pre-encoded bytes instead of walking the dict through json.dumps
+_SEARCH_BODY = orjson.dumps({
+    "user_id": "test-user-123",
+    "date_from": "2025-09-01T00:00:00Z"
+})
+
 def test_create_flight_plan():
     """Test creating a flight plan"""
     print("🧪 Testing Flight Plan Creation")
     print("=" * 40)
     
-    # Sample data for flight plan creation
-    test_data = {
-        "route_details": {
-            "origin": "KJFK",
-            "destination": "KLAX",
-            "distance_nm": 2144.5,
-            "estimated_time_min": 360
-        },
-        "weather_summary": {
-            "summary_text": ["Clear skies", "Light winds"],
-            "risk_index": "green"
-        },
-        "risk_analysis": {
-            "risks": [],
-            "overall_risk": "low"
-        },
-        "map_layers": {
-            "route_coordinates": [
-                [-73.7781, 40.6413],
-                [-118.4081, 33.9425]
-            ]
-        },
-        "chart_data": {
-            "generated_at": datetime.utcnow().isoformat()
-        },
-        "user_id": "test-user-123"
-    }
-    
+    # Static payload comes from the mmapped Arrow fixture; chart_data
+    # carries the run's timestamp, so it is added and encoded at call time
+    # (orjson renders the datetime object to a Z-suffixed UTC string)
+    test_data = dict(load_flight_plan_examples()[0])
+    test_data["chart_data"] = {"generated_at": datetime.utcnow()}
+
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flight-plans",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flight-plans",
+            content=orjson.dumps(test_data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z),
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
@@ -75,7 +71,7 @@ def test_get_flight_plan(plan_id):
     print("=" * 40)
     
     try:
-        response = requests.get(f"{BASE_URL}/api/flight-plans/{plan_id}")
+        response = _client.get(f"/api/flight-plans/{plan_id}")
         
         if response.status_code == 200:
             result = response.json()
@@ -97,7 +93,7 @@ def test_get_all_flight_plans():
     print("=" * 40)
     
     try:
-        response = requests.get(f"{BASE_URL}/api/flight-plans?limit=10")
+        response = _client.get("/api/flight-plans?limit=10")
         
         if response.status_code == 200:
             result = response.json()
@@ -128,10 +124,7 @@ def test_generate_and_save_flight_plan():
             "departure_time": "2025-09-27T10:00:00Z"
         }
         
-        response = requests.post(
-            f"{BASE_URL}/api/flight-plans/generate-and-save",
-            params=params
-        )
+        response = _client.post("/api/flight-plans/generate-and-save", params=params)
         
         if response.status_code == 200:
             result = response.json()
@@ -159,16 +152,11 @@ def test_search_flight_plans():
     print(f"\n🔍 Testing Flight Plan Search")
     print("=" * 40)
     
-    search_criteria = {
-        "user_id": "test-user-123",
-        "date_from": "2025-09-01T00:00:00Z"
-    }
-    
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flight-plans/search",
-            json=search_criteria,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flight-plans/search",
+            content=_SEARCH_BODY,
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
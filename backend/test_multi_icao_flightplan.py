@@ -4,29 +4,57 @@ Test script for Multi-ICAO Flight Plan Generation endpoint
 Tests the updated /api/flightplan/generate endpoint with multiple ICAO codes
 """
 
-import requests
+import atexit
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+import httpx
+import orjson
+
 BASE_URL = "http://localhost:8000"
 
+# One pooled client for the whole suite: keep-alive reuses the TCP
+# connection across tests instead of paying a fresh handshake per call
+_client = httpx.Client(base_url=BASE_URL, timeout=30.0)
+atexit.register(_client.close)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static request bodies are encoded to bytes once at import time, so each
+# call just sends the pre-serialized payload instead of re-running json.dumps
+BODY_TWO_AIRPORTS = orjson.dumps({
+    "icao_codes": ["KJFK", "KLAX"],
+    "departure_time": "2025-09-27T10:00:00Z",
+    "user_id": "test-user-123",
+    "circular": False
+})
+
+BODY_MULTI_LEG = orjson.dumps({
+    "icao_codes": ["KJFK", "EGLL", "EDDF", "RJTT"],
+    "departure_time": "2025-09-27T08:00:00Z",
+    "user_id": "test-user-456",
+    "circular": False
+})
+
+BODY_CIRCULAR = orjson.dumps({
+    "icao_codes": ["KJFK", "KLAX", "EGLL"],
+    "departure_time": "2025-09-27T06:00:00Z",
+    "user_id": "test-user-789",
+    "circular": True
+})
+
 def test_basic_two_airport_plan():
     """Test basic two-airport flight plan (like the old functionality)"""
     print("🧪 Testing Basic Two-Airport Flight Plan")
     print("=" * 50)
     
-    test_data = {
-        "icao_codes": ["KJFK", "KLAX"],
-        "departure_time": "2025-09-27T10:00:00Z",
-        "user_id": "test-user-123",
-        "circular": False
-    }
-    
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flightplan/generate",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flightplan/generate",
+            content=BODY_TWO_AIRPORTS,
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
@@ -60,18 +88,11 @@ def test_multi_leg_flight_plan():
     print(f"\n🌍 Testing Multi-Leg Flight Plan (4 Airports)")
     print("=" * 50)
     
-    test_data = {
-        "icao_codes": ["KJFK", "EGLL", "EDDF", "RJTT"],
-        "departure_time": "2025-09-27T08:00:00Z",
-        "user_id": "test-user-456",
-        "circular": False
-    }
-    
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flightplan/generate",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flightplan/generate",
+            content=BODY_MULTI_LEG,
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
@@ -109,18 +130,11 @@ def test_circular_flight_plan():
     print(f"\n🔄 Testing Circular Flight Plan")
     print("=" * 50)
     
-    test_data = {
-        "icao_codes": ["KJFK", "KLAX", "EGLL"],
-        "departure_time": "2025-09-27T06:00:00Z",
-        "user_id": "test-user-789",
-        "circular": True
-    }
-    
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flightplan/generate",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flightplan/generate",
+            content=BODY_CIRCULAR,
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
@@ -166,21 +180,19 @@ def test_validation_errors():
         }
     ]
     
-    for test_case in test_cases:
-        try:
-            response = requests.post(
-                f"{BASE_URL}/api/flightplan/generate",
-                json=test_case["data"],
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code == 400:
-                print(f"✅ {test_case['name']}: Correctly rejected")
-            else:
-                print(f"❌ {test_case['name']}: Expected 400 but got {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ {test_case['name']}: Error - {e}")
+    # The invalid payloads are independent, so send them concurrently
+    # over the pooled client and report in order
+    def _post_case(test_case):
+        return _client.post("/api/flightplan/generate", json=test_case["data"])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(_post_case, test_cases))
+
+    for test_case, response in zip(test_cases, responses):
+        if response.status_code == 400:
+            print(f"✅ {test_case['name']}: Correctly rejected")
+        else:
+            print(f"❌ {test_case['name']}: Expected 400 but got {response.status_code}")
 
 
 def test_real_world_scenario():
@@ -188,19 +200,21 @@ def test_real_world_scenario():
     print(f"\n🌏 Testing Real-World Multi-City Trip")
     print("=" * 50)
     
-    # Example: New York -> Los Angeles -> London -> Frankfurt -> Tokyo
+    # Example: New York -> Los Angeles -> London -> Frankfurt -> Tokyo.
+    # The departure time varies per run, so encode at call time and let
+    # orjson render the datetime straight to a Z-suffixed UTC string
     test_data = {
         "icao_codes": ["KJFK", "KLAX", "EGLL", "EDDF", "RJTT"],
-        "departure_time": (datetime.utcnow() + timedelta(days=1)).isoformat() + "Z",
+        "departure_time": datetime.utcnow() + timedelta(days=1),
         "user_id": "real-world-test",
         "circular": False
     }
-    
+
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/flightplan/generate",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
+        response = _client.post(
+            "/api/flightplan/generate",
+            content=orjson.dumps(test_data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z),
+            headers=_JSON_HEADERS
         )
         
         if response.status_code == 200:
@@ -263,4 +277,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Block-buffer stdout for the run: the suite prints a lot of per-leg
+    # detail and line-buffered flushes add up on slow terminals/CI logs
+    sys.stdout.reconfigure(line_buffering=False)
+    main()
+    sys.stdout.flush()
\ No newline at end of file
@@ -3,96 +3,104 @@
 Test script for multi-leg route endpoint with new frontend format
 """
 
-import requests
+import asyncio
 import json
-from datetime import datetime
-
-def test_multi_leg_route():
-    """Test the multi-leg route endpoint with the new format"""
-    
-    # Test data matching your frontend format
-    test_data = {
-        "icao_codes": [
-            "KJFK",
-            "KLAX", 
-            "EGLL",
-            "EDDF",
-            "RJTT"
-        ],
-        "request_date": "2025-09-26T12:00:00Z",
-        "circular": False
-    }
-    
+
+import httpx
+import orjson
+
+ROUTE_URL = "http://localhost:8000/api/flightpath/summary/route"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static request bodies, encoded once at import; the dicts are kept for
+# the human-readable echo at the top of each report
+MULTI_LEG_DATA = {
+    "icao_codes": [
+        "KJFK",
+        "KLAX",
+        "EGLL",
+        "EDDF",
+        "RJTT"
+    ],
+    "request_date": "2025-09-26T12:00:00Z",
+    "circular": False
+}
+
+CIRCULAR_DATA = {
+    "icao_codes": ["KJFK", "KLAX", "EGLL"],
+    "request_date": "2025-09-26T12:00:00Z",
+    "circular": True
+}
+
+_BODY_MULTI_LEG = orjson.dumps(MULTI_LEG_DATA)
+_BODY_CIRCULAR = orjson.dumps(CIRCULAR_DATA)
+
+
+def report_multi_leg(response: httpx.Response) -> None:
+    """Report the multi-leg route response"""
     print("🧪 Testing Multi-Leg Route Endpoint")
     print("=" * 40)
-    print(f"Request data: {json.dumps(test_data, indent=2)}")
+    print(f"Request data: {json.dumps(MULTI_LEG_DATA, indent=2)}")
     print()
-    
+
+    if response.status_code == 200:
+        result = response.json()
+        print("✅ Request successful!")
+        print(f"📊 Total Distance: {result['total_distance_km']} km ({result['total_distance_nm']} nm)")
+        print(f"🛫 Route: {' -> '.join(result['icao_codes'])}")
+        print(f"📅 Request Date: {result['request_date']}")
+        print(f"🔄 Circular: {result['circular']}")
+        print(f"📍 Total Points: {result['total_points']}")
+        print(f"🗺️ Segments: {len(result['segments'])}")
+
+        print("\n📋 Segment Details:")
+        for i, segment in enumerate(result['segments'], 1):
+            print(f"  {i}. {segment['origin']} -> {segment['destination']}: "
+                  f"{segment['distance_km']} km ({segment['distance_nm']} nm)")
+
+    else:
+        print(f"❌ Request failed with status {response.status_code}")
+        print(f"Error: {response.text}")
+
+
+def report_circular(response: httpx.Response) -> None:
+    """Report the circular route response"""
+    print("\n🔄 Testing Circular Route")
+    print("=" * 40)
+    print(f"Request data: {json.dumps(CIRCULAR_DATA, indent=2)}")
+
+    if response.status_code == 200:
+        result = response.json()
+        print("✅ Circular route test successful!")
+        print(f"🛫 Route: {' -> '.join(result['icao_codes'])} -> {result['icao_codes'][0]}")
+        print(f"📊 Total Distance: {result['total_distance_km']} km")
+        print(f"🗺️ Segments: {len(result['segments'])}")
+    else:
+        print(f"❌ Circular route test failed: {response.text}")
+
+
+async def run_tests() -> None:
+    """Send both route payloads concurrently over one pooled client"""
     try:
-        # Make request to the endpoint
-        response = requests.post(
-            "http://localhost:8000/api/flightpath/summary/route",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ Request successful!")
-            print(f"📊 Total Distance: {result['total_distance_km']} km ({result['total_distance_nm']} nm)")
-            print(f"🛫 Route: {' -> '.join(result['icao_codes'])}")
-            print(f"📅 Request Date: {result['request_date']}")
-            print(f"🔄 Circular: {result['circular']}")
-            print(f"📍 Total Points: {result['total_points']}")
-            print(f"🗺️ Segments: {len(result['segments'])}")
-            
-            print("\n📋 Segment Details:")
-            for i, segment in enumerate(result['segments'], 1):
-                print(f"  {i}. {segment['origin']} -> {segment['destination']}: "
-                      f"{segment['distance_km']} km ({segment['distance_nm']} nm)")
-                      
-        else:
-            print(f"❌ Request failed with status {response.status_code}")
-            print(f"Error: {response.text}")
-            
-    except requests.exceptions.ConnectionError:
+        # The two requests are independent: one gather over a shared
+        # keep-alive connection lets the server overlap both calculations
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            multi_leg_response, circular_response = await asyncio.gather(
+                client.post(ROUTE_URL, content=_BODY_MULTI_LEG, headers=_JSON_HEADERS),
+                client.post(ROUTE_URL, content=_BODY_CIRCULAR, headers=_JSON_HEADERS),
+            )
+    except httpx.ConnectError:
         print("❌ Connection failed. Make sure the FastAPI server is running on localhost:8000")
         print("Start the server with: python main.py")
+        return
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
+        return
+
+    report_multi_leg(multi_leg_response)
+    report_circular(circular_response)
 
-def test_circular_route():
-    """Test with circular route enabled"""
-    
-    test_data = {
-        "icao_codes": ["KJFK", "KLAX", "EGLL"],
-        "request_date": "2025-09-26T12:00:00Z",
-        "circular": True
-    }
-    
-    print("\n🔄 Testing Circular Route")
-    print("=" * 40)
-    print(f"Request data: {json.dumps(test_data, indent=2)}")
-    
-    try:
-        response = requests.post(
-            "http://localhost:8000/api/flightpath/summary/route",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ Circular route test successful!")
-            print(f"🛫 Route: {' -> '.join(result['icao_codes'])} -> {result['icao_codes'][0]}")
-            print(f"📊 Total Distance: {result['total_distance_km']} km")
-            print(f"🗺️ Segments: {len(result['segments'])}")
-        else:
-            print(f"❌ Circular route test failed: {response.text}")
-            
-    except Exception as e:
-        print(f"❌ Error in circular route test: {e}")
 
 if __name__ == "__main__":
-    test_multi_leg_route()
-    test_circular_route()
\ No newline at end of file
+    asyncio.run(run_tests())
@@ -9,164 +9,431 @@ Usage:
     Enter ICAO code when prompted (e.g., KJFK, EGLL, OMDB)
 """
 
-import requests
+import argparse
+import asyncio
+import io
 import json
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+import orjson
+
+
+@lru_cache(maxsize=4096)
+def _lookup_icao_coords(icao_code: str) -> Optional[Tuple[float, float]]:
+    """Resolve coordinates for an airport missing from the local table.
+
+    The Supabase-backed lookup is imported lazily (get_path needs .env
+    credentials at import) and memoized, so repeated queries for the same
+    airport in an interactive session hit the cache, not the database.
+    """
+    try:
+        from get_path import find_airport_by_icao
+    except Exception as e:
+        print(f"⚠️ Airport database unavailable for {icao_code}: {e}")
+        return None
+
+    airport = find_airport_by_icao(icao_code)
+    if airport:
+        return airport['latitude'], airport['longitude']
+    return None
+
+
+# (output key, source key) maps for the summary transforms: hoisting the
+# key pairs lets each record be reshaped by one dict comprehension instead
+# of a run of individual .get() appends per record
+_METAR_FIELDS = (
+    ("observation_time", "obsTime"),
+    ("raw_metar", "rawOb"),
+    ("flight_category", "fltcat"),
+    ("temperature_celsius", "temp"),
+    ("dewpoint_celsius", "dewp"),
+    ("wind_direction", "wdir"),
+    ("wind_speed_knots", "wspd"),
+    ("wind_gust_knots", "wgst"),
+    ("visibility_miles", "visib"),
+    ("altimeter_inhg", "altim"),
+    ("sea_level_pressure_mb", "slp"),
+    ("weather_conditions", "wxString"),
+    ("sky_conditions", "clds"),
+    ("remarks", "rmk"),
+)
+
+_TAF_FIELDS = (
+    ("issue_time", "issueTime"),
+    ("bulletin_time", "bulletinTime"),
+    ("valid_time_from", "validTimeFrom"),
+    ("valid_time_to", "validTimeTo"),
+    ("raw_taf", "rawTAF"),
+)
+
+_PIREP_FIELDS = (
+    ("observation_time", "obsTime"),
+    ("aircraft_type", "acType"),
+    ("flight_level", "fltlvl"),
+    ("turbulence", "turb"),
+    ("icing", "ice"),
+    ("visibility", "vis"),
+    ("temperature", "tmp"),
+    ("wind", "wnd"),
+    ("location", "location"),
+    ("raw_pirep", "rawOb"),
+)
+
+@dataclass(slots=True, frozen=True)
+class Pirep:
+    """Slot-backed pilot report row for the summary.
+
+    A batched response can carry hundreds of reports; slots drop the
+    per-entry dict overhead roughly 3x, and orjson serializes dataclasses
+    natively so the output path is unchanged. Field order matches
+    _PIREP_FIELDS so instances build positionally from a record.
+    """
+    observation_time: Optional[str]
+    aircraft_type: Optional[str]
+    flight_level: Optional[int]
+    turbulence: Optional[str]
+    icing: Optional[str]
+    visibility: Optional[str]
+    temperature: Optional[int]
+    wind: Optional[str]
+    location: Optional[str]
+    raw_pirep: Optional[str]
+
+
+_SIGMET_FIELDS = (
+    ("hazard", "hazard"),
+    ("severity", "severity"),
+    ("type", "sigmetType"),
+    ("valid_time_from", "validTimeFrom"),
+    ("valid_time_to", "validTimeTo"),
+    ("raw_sigmet", "rawSigmet"),
+)
+
+_AIRMET_FIELDS = (
+    ("hazard", "hazard"),
+    ("severity", "severity"),
+    ("valid_time_from", "validTimeFrom"),
+    ("valid_time_to", "validTimeTo"),
+    ("raw_airmet", "rawAirmet"),
+)
+
 
 class AviationWeatherTester:
+    # Known coordinates for the commonly tested airports, built once at
+    # import instead of per bbox call
+    _AIRPORT_COORDS = {
+        'KJFK': (40.6413, -73.7781),  # JFK New York
+        'KLAX': (33.9425, -118.4081), # LAX Los Angeles
+        'EGLL': (51.4700, -0.4543),   # Heathrow London
+        'OMDB': (25.2532, 55.3657),   # Dubai
+        'LFPG': (49.0097, 2.5479),    # Charles de Gaulle Paris
+        'EDDF': (50.0264, 8.5431),    # Frankfurt
+        'RJTT': (35.5494, 139.7798),  # Narita Tokyo
+        'YSSY': (-33.9399, 151.1753), # Sydney
+        'CYYZ': (43.6777, -79.6248),  # Toronto Pearson
+        'ZBAA': (40.0725, 116.5974)   # Beijing Capital
+    }
+
+    # Response TTLs for the slowly-changing endpoints: METARs update
+    # hourly and TAFs every six hours, so interactive re-queries within
+    # these windows serve the cached body instead of re-downloading.
+    # Class-level so the per-airport testers of a batch run share it.
+    _RESPONSE_TTLS = {'metar': 300.0, 'taf': 1800.0}
+    _response_cache: Dict[Tuple, Tuple[float, List]] = {}
+
     def __init__(self):
         self.base_url = "https://aviationweather.gov/api/data"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'AviFlux-Weather-Tester/1.0',
-            'Accept': 'application/json'
-        })
-    
-    def get_metar_data(self, icao_code: str) -> Optional[Dict]:
-        """Fetch METAR data for airport"""
+            'Accept': 'application/json',
+            # JSON compresses well; ask for gzip explicitly so large
+            # SIGMET/PIREP bodies arrive at a fraction of the wire bytes
+            'Accept-Encoding': 'gzip'
+        }
+        # Status lines accumulate here and flush as one stdout write per
+        # test, instead of a lock-and-flush syscall per print
+        self._out = io.StringIO()
+
+    def _log(self, message: str) -> None:
+        """Buffer a status line for the current test run."""
+        self._out.write(message + '\n')
+
+    def _flush_log(self) -> None:
+        """Write the buffered status lines to stdout and reset the buffer."""
+        sys.stdout.write(self._out.getvalue())
+        self._out.seek(0)
+        self._out.truncate()
+
+    def make_client(self) -> httpx.AsyncClient:
+        """Build the pooled async client the fetchers share.
+
+        One persistent connection pool serves every request of a session,
+        so only the first request to aviationweather.gov pays the TCP+TLS
+        handshake; connection-level failures are retried by the transport.
+        """
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        )
+
+    async def _fetch(self, client: httpx.AsyncClient, endpoint: str,
+                     params: Dict, label: str, status_line: str) -> Optional[List]:
+        """Shared request path for every endpoint fetcher.
+
+        One implementation of status line, request, raise_for_status and
+        orjson decode; the per-endpoint methods reduce to their params.
+        METAR/TAF responses are additionally memoized for their TTL.
+        """
+        ttl = self._RESPONSE_TTLS.get(endpoint)
+        cache_key = (endpoint, tuple(sorted(params.items()))) if ttl else None
+        if cache_key is not None:
+            entry = self._response_cache.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._log(f"♻️  {label}: using cached response")
+                return entry[1]
+
         try:
-            url = f"{self.base_url}/metar"
-            params = {
-                'ids': icao_code,
-                'format': 'json',
-                'taf': 'false',
-                'hours': '3'  # Last 3 hours of METAR data
-            }
-            
-            print(f"🌤️  Fetching METAR data for {icao_code}...")
-            response = self.session.get(url, params=params, timeout=10)
+            self._log(status_line)
+            response = await client.get(f"{self.base_url}/{endpoint}", params=params)
             response.raise_for_status()
-            
-            data = response.json()
+
+            data = orjson.loads(response.content)
+            if cache_key is not None and data:
+                self._response_cache[cache_key] = (time.monotonic() + ttl, data)
             return data if data else None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ METAR fetch error: {e}")
+
+        except httpx.HTTPError as e:
+            self._log(f"❌ {label} fetch error: {e}")
             return None
         except json.JSONDecodeError as e:
-            print(f"❌ METAR JSON decode error: {e}")
+            self._log(f"❌ {label} JSON decode error: {e}")
             return None
-    
-    def get_taf_data(self, icao_code: str) -> Optional[Dict]:
+
+    async def get_metar_data(self, client: httpx.AsyncClient, icao_code: str) -> Optional[List]:
+        """Fetch METAR data for airport"""
+        return await self._fetch(
+            client, 'metar',
+            {
+                'ids': icao_code,
+                'format': 'json',
+                'taf': 'false',
+                'hours': '3'  # Last 3 hours of METAR data
+            },
+            'METAR',
+            f"🌤️  Fetching METAR data for {icao_code}..."
+        )
+
+    async def get_taf_data(self, client: httpx.AsyncClient, icao_code: str) -> Optional[List]:
         """Fetch TAF data for airport"""
-        try:
-            url = f"{self.base_url}/taf"
-            params = {
+        return await self._fetch(
+            client, 'taf',
+            {
                 'ids': icao_code,
                 'format': 'json',
                 'hours': '30'  # Next 30 hours of TAF data
-            }
-            
-            print(f"🔮 Fetching TAF data for {icao_code}...")
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data if data else None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ TAF fetch error: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ TAF JSON decode error: {e}")
-            return None
-    
-    def get_pirep_data(self, icao_code: str) -> Optional[Dict]:
+            },
+            'TAF',
+            f"🔮 Fetching TAF data for {icao_code}..."
+        )
+
+    async def get_pirep_data(self, client: httpx.AsyncClient, icao_code: str) -> Optional[List]:
         """Fetch PIREP data around airport"""
-        try:
-            url = f"{self.base_url}/pirep"
-            params = {
+        return await self._fetch(
+            client, 'pirep',
+            {
                 'bbox': self._get_bbox_for_airport(icao_code),
                 'format': 'json',
                 'hours': '6'  # Last 6 hours of PIREPs
-            }
-            
-            print(f"✈️  Fetching PIREP data around {icao_code}...")
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data if data else None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ PIREP fetch error: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ PIREP JSON decode error: {e}")
-            return None
-    
-    def get_sigmet_data(self, icao_code: str) -> Optional[Dict]:
+            },
+            'PIREP',
+            f"✈️  Fetching PIREP data around {icao_code}..."
+        )
+
+    async def get_sigmet_data(self, client: httpx.AsyncClient, icao_code: str) -> Optional[List]:
         """Fetch SIGMET data around airport"""
-        try:
-            url = f"{self.base_url}/sigmet"
-            params = {
+        return await self._fetch(
+            client, 'sigmet',
+            {
                 'bbox': self._get_bbox_for_airport(icao_code),
                 'format': 'json',
                 'hazards': 'convective,turbulence,icing,ifr,mountain_obscuration,volcanic_ash,dust_sand'
-            }
-            
-            print(f"⚠️  Fetching SIGMET data around {icao_code}...")
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data if data else None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ SIGMET fetch error: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ SIGMET JSON decode error: {e}")
-            return None
-    
-    def get_airmet_data(self, icao_code: str) -> Optional[Dict]:
+            },
+            'SIGMET',
+            f"⚠️  Fetching SIGMET data around {icao_code}..."
+        )
+
+    async def get_airmet_data(self, client: httpx.AsyncClient, icao_code: str) -> Optional[List]:
         """Fetch AIRMET data around airport"""
-        try:
-            url = f"{self.base_url}/airmet"
-            params = {
+        return await self._fetch(
+            client, 'airmet',
+            {
                 'bbox': self._get_bbox_for_airport(icao_code),
                 'format': 'json'
+            },
+            'AIRMET',
+            f"🌪️  Fetching AIRMET data around {icao_code}..."
+        )
+
+    async def get_metar_data_batch(self, client: httpx.AsyncClient,
+                                   icao_codes: List[str]) -> Dict[str, List[Dict]]:
+        """Fetch METAR for several airports in one comma-separated request.
+
+        The /metar endpoint accepts ids=KJFK,KLAX,..., so a multi-leg route
+        costs one round-trip instead of one per airport; the response is
+        grouped back by reporting station.
+        """
+        data = await self._fetch(
+            client, 'metar',
+            {
+                'ids': ','.join(icao_codes),
+                'format': 'json',
+                'taf': 'false',
+                'hours': '3'
+            },
+            'METAR batch',
+            f"🌤️  Fetching METAR data for {', '.join(icao_codes)}..."
+        )
+
+        grouped: Dict[str, List[Dict]] = {}
+        for record in data or []:
+            grouped.setdefault(record.get('icaoId'), []).append(record)
+        return grouped
+
+    async def get_taf_data_batch(self, client: httpx.AsyncClient,
+                                 icao_codes: List[str]) -> Dict[str, List[Dict]]:
+        """Fetch TAF for several airports in one comma-separated request."""
+        data = await self._fetch(
+            client, 'taf',
+            {
+                'ids': ','.join(icao_codes),
+                'format': 'json',
+                'hours': '30'
+            },
+            'TAF batch',
+            f"🔮 Fetching TAF data for {', '.join(icao_codes)}..."
+        )
+
+        grouped: Dict[str, List[Dict]] = {}
+        for record in data or []:
+            grouped.setdefault(record.get('icaoId'), []).append(record)
+        return grouped
+
+    async def test_route_weather(self, client: httpx.AsyncClient,
+                                 icao_codes: List[str]) -> Dict[str, Dict]:
+        """Fetch weather for a whole route with batched ID-keyed calls.
+
+        METAR and TAF go out as one batched request each and SIGMET as a
+        single union-bbox request; only PIREP stays per airport (a
+        route-wide PIREP box would drown each airport in unrelated
+        reports), and all of it runs in one concurrent gather.
+        """
+        icao_codes = [c.upper().strip() for c in icao_codes]
+
+        results = await asyncio.gather(
+            self.get_metar_data_batch(client, icao_codes),
+            self.get_taf_data_batch(client, icao_codes),
+            self.get_route_sigmet_data(client, icao_codes),
+            *(self.get_pirep_data(client, icao) for icao in icao_codes),
+        )
+        metar_by_icao, taf_by_icao, route_sigmet = results[0], results[1], results[2]
+        pireps = results[3:]
+
+        airports = {}
+        for i, icao in enumerate(icao_codes):
+            airports[icao] = {
+                'metar': metar_by_icao.get(icao),
+                'taf': taf_by_icao.get(icao),
+                'pirep': pireps[i],
             }
-            
-            print(f"🌪️  Fetching AIRMET data around {icao_code}...")
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data if data else None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ AIRMET fetch error: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ AIRMET JSON decode error: {e}")
+
+        self._flush_log()
+        # SIGMETs cover the union area, so they are reported route-wide
+        # rather than attributed to a single airport
+        return {'airports': airports, 'sigmet': route_sigmet}
+
+    def _get_route_bbox(self, icao_codes: List[str]) -> Optional[str]:
+        """Union bounding box covering every airport of a route.
+
+        One padded min/max over the coordinate array replaces N separate
+        per-airport boxes, so the bbox-keyed endpoints can be asked once
+        for the whole route. Returns None when the longitudes span more
+        than 180°: for an antimeridian-crossing route (e.g. KLAX -> RJTT)
+        the naive min/max box covers the wrong hemisphere entirely, so
+        the caller must fall back to per-airport boxes.
+        """
+        coords = []
+        for icao in icao_codes:
+            c = self._AIRPORT_COORDS.get(icao) or _lookup_icao_coords(icao)
+            if c:
+                coords.append(c)
+        if not coords:
+            return self._get_bbox_for_airport(icao_codes[0])
+
+        arr = np.asarray(coords, dtype=np.float64)
+        if arr[:, 1].max() - arr[:, 1].min() > 180.0:
             return None
-    
+        delta = 0.75  # Approximately 50nm in degrees
+        lat_min, lon_min = arr.min(axis=0) - delta
+        lat_max, lon_max = arr.max(axis=0) + delta
+        return f"{lat_min},{lon_min},{lat_max},{lon_max}"
+
+    async def get_route_sigmet_data(self, client: httpx.AsyncClient,
+                                    icao_codes: List[str]) -> Optional[List]:
+        """Fetch SIGMET data once for the union bbox of a whole route.
+
+        Antimeridian-crossing routes have no single valid bbox, so they
+        fall back to one concurrent query per airport with the results
+        deduplicated across the overlapping boxes.
+        """
+        bbox = self._get_route_bbox(icao_codes)
+        if bbox is None:
+            per_airport = await asyncio.gather(
+                *(self.get_sigmet_data(client, icao) for icao in icao_codes)
+            )
+            seen = set()
+            merged = []
+            for data in per_airport:
+                for record in data or []:
+                    key = record.get('airSigmetId') or record.get('rawSigmet')
+                    if key is not None and key in seen:
+                        continue
+                    seen.add(key)
+                    merged.append(record)
+            return merged or None
+
+        return await self._fetch(
+            client, 'sigmet',
+            {
+                'bbox': bbox,
+                'format': 'json',
+                'hazards': 'convective,turbulence,icing,ifr,mountain_obscuration,volcanic_ash,dust_sand'
+            },
+            'Route SIGMET',
+            f"⚠️  Fetching SIGMET data for route {' -> '.join(icao_codes)}..."
+        )
+
     def _get_bbox_for_airport(self, icao_code: str) -> str:
         """Get bounding box around airport for PIREP/SIGMET queries"""
-        # This is a simplified approach - in production, you'd use actual airport coordinates
-        # Common airport coordinates (you can expand this)
-        airport_coords = {
-            'KJFK': (40.6413, -73.7781),  # JFK New York
-            'KLAX': (33.9425, -118.4081), # LAX Los Angeles
-            'EGLL': (51.4700, -0.4543),   # Heathrow London
-            'OMDB': (25.2532, 55.3657),   # Dubai
-            'LFPG': (49.0097, 2.5479),    # Charles de Gaulle Paris
-            'EDDF': (50.0264, 8.5431),    # Frankfurt
-            'RJTT': (35.5494, 139.7798),  # Narita Tokyo
-            'YSSY': (-33.9399, 151.1753), # Sydney
-            'CYYZ': (43.6777, -79.6248),  # Toronto Pearson
-            'ZBAA': (40.0725, 116.5974)   # Beijing Capital
-        }
-        
-        if icao_code in airport_coords:
-            lat, lon = airport_coords[icao_code]
-        else:
-            # Default to a central US location if airport not in our list
-            lat, lon = 39.8283, -98.5795  # Geographic center of US
-        
+        coords = self._AIRPORT_COORDS.get(icao_code)
+        if coords is None:
+            # Not in the local table: resolve through the cached airport
+            # database lookup instead of silently boxing the center of
+            # the US (which returns empty/garbage data for e.g. EGLL)
+            coords = _lookup_icao_coords(icao_code)
+        if coords is None:
+            # Last resort when the database is unreachable or unaware
+            coords = (39.8283, -98.5795)  # Geographic center of US
+        lat, lon = coords
+
         # Create 50nm radius bounding box
         delta = 0.75  # Approximately 50nm in degrees
         return f"{lat-delta},{lon-delta},{lat+delta},{lon+delta}"
@@ -184,215 +451,238 @@ class AviationWeatherTester:
             latest_metar = weather_data['metar'][0]
             summary['current_weather'] = {
                 "source": "METAR",
-                "observation_time": latest_metar.get('obsTime'),
-                "raw_metar": latest_metar.get('rawOb'),
-                "flight_category": latest_metar.get('fltcat'),
-                "temperature_celsius": latest_metar.get('temp'),
-                "dewpoint_celsius": latest_metar.get('dewp'),
-                "wind_direction": latest_metar.get('wdir'),
-                "wind_speed_knots": latest_metar.get('wspd'),
-                "wind_gust_knots": latest_metar.get('wgst'),
-                "visibility_miles": latest_metar.get('visib'),
-                "altimeter_inhg": latest_metar.get('altim'),
-                "sea_level_pressure_mb": latest_metar.get('slp'),
-                "weather_conditions": latest_metar.get('wxString'),
-                "sky_conditions": latest_metar.get('clds'),
-                "remarks": latest_metar.get('rmk')
+                **{out: latest_metar.get(src) for out, src in _METAR_FIELDS}
             }
             summary['data_sources'].append("METAR")
-        
+
         # Process TAF data
         if weather_data.get('taf') and len(weather_data['taf']) > 0:
             latest_taf = weather_data['taf'][0]
             summary['forecast'] = {
                 "source": "TAF",
-                "issue_time": latest_taf.get('issueTime'),
-                "bulletin_time": latest_taf.get('bulletinTime'),
-                "valid_time_from": latest_taf.get('validTimeFrom'),
-                "valid_time_to": latest_taf.get('validTimeTo'),
-                "raw_taf": latest_taf.get('rawTAF'),
+                **{out: latest_taf.get(src) for out, src in _TAF_FIELDS},
                 "forecast_periods": latest_taf.get('fcsts', [])
             }
             summary['data_sources'].append("TAF")
-        
+
         # Process PIREP data
         if weather_data.get('pirep') and len(weather_data['pirep']) > 0:
             summary['pilot_reports'] = {
                 "source": "PIREP",
                 "report_count": len(weather_data['pirep']),
-                "reports": []
+                "reports": [
+                    Pirep(*(p.get(src) for _, src in _PIREP_FIELDS))
+                    for p in weather_data['pirep'][:10]  # Limit to 10 most recent
+                ]
             }
-            
-            for pirep in weather_data['pirep'][:10]:  # Limit to 10 most recent
-                summary['pilot_reports']['reports'].append({
-                    "observation_time": pirep.get('obsTime'),
-                    "aircraft_type": pirep.get('acType'),
-                    "flight_level": pirep.get('fltlvl'),
-                    "turbulence": pirep.get('turb'),
-                    "icing": pirep.get('ice'),
-                    "visibility": pirep.get('vis'),
-                    "temperature": pirep.get('tmp'),
-                    "wind": pirep.get('wnd'),
-                    "location": pirep.get('location'),
-                    "raw_pirep": pirep.get('rawOb')
-                })
             summary['data_sources'].append("PIREP")
-        
+
         # Process SIGMET data
         if weather_data.get('sigmet') and len(weather_data['sigmet']) > 0:
             summary['significant_weather'] = {
                 "source": "SIGMET",
                 "warning_count": len(weather_data['sigmet']),
-                "warnings": []
+                "warnings": [
+                    {
+                        **{out: s.get(src) for out, src in _SIGMET_FIELDS},
+                        "altitude_range": {
+                            "top": s.get('altitudeHi1'),
+                            "bottom": s.get('altitudeLo1')
+                        }
+                    }
+                    for s in weather_data['sigmet']
+                ]
             }
-            
-            for sigmet in weather_data['sigmet']:
-                summary['significant_weather']['warnings'].append({
-                    "hazard": sigmet.get('hazard'),
-                    "severity": sigmet.get('severity'),
-                    "type": sigmet.get('sigmetType'),
-                    "valid_time_from": sigmet.get('validTimeFrom'),
-                    "valid_time_to": sigmet.get('validTimeTo'),
-                    "altitude_range": {
-                        "top": sigmet.get('altitudeHi1'),
-                        "bottom": sigmet.get('altitudeLo1')
-                    },
-                    "raw_sigmet": sigmet.get('rawSigmet')
-                })
             summary['data_sources'].append("SIGMET")
-        
+
         # Process AIRMET data
         if weather_data.get('airmet') and len(weather_data['airmet']) > 0:
             summary['airmen_meteorological_info'] = {
                 "source": "AIRMET",
                 "advisory_count": len(weather_data['airmet']),
-                "advisories": []
+                "advisories": [
+                    {out: a.get(src) for out, src in _AIRMET_FIELDS}
+                    for a in weather_data['airmet']
+                ]
             }
-            
-            for airmet in weather_data['airmet']:
-                summary['airmen_meteorological_info']['advisories'].append({
-                    "hazard": airmet.get('hazard'),
-                    "severity": airmet.get('severity'),
-                    "valid_time_from": airmet.get('validTimeFrom'),
-                    "valid_time_to": airmet.get('validTimeTo'),
-                    "raw_airmet": airmet.get('rawAirmet')
-                })
             summary['data_sources'].append("AIRMET")
-        
+
         return summary
     
-    def test_airport_weather(self, icao_code: str) -> Dict:
+    async def test_airport_weather(self, client: httpx.AsyncClient, icao_code: str) -> Dict:
         """Comprehensive weather test for an airport"""
         icao_code = icao_code.upper().strip()
-        
+
         if len(icao_code) != 4:
             raise ValueError("ICAO code must be exactly 4 characters")
-        
-        print(f"\n{'='*60}")
-        print(f"🛩️  TESTING AVIATION WEATHER FOR {icao_code}")
-        print(f"{'='*60}")
-        
+
+        self._log(f"\n{'='*60}")
+        self._log(f"🛩️  TESTING AVIATION WEATHER FOR {icao_code}")
+        self._log(f"{'='*60}")
+
+        # The five endpoints are independent, so fire them concurrently over
+        # the shared client: wall time is ~max(RTT) instead of the sum, and
+        # each fetcher already handles its own errors by returning None
+        metar_data, taf_data, pirep_data, sigmet_data, airmet_data = await asyncio.gather(
+            self.get_metar_data(client, icao_code),
+            self.get_taf_data(client, icao_code),
+            self.get_pirep_data(client, icao_code),
+            self.get_sigmet_data(client, icao_code),
+            self.get_airmet_data(client, icao_code),
+        )
+
         # Collect all weather data
         weather_data = {}
-        
-        # Fetch METAR
-        metar_data = self.get_metar_data(icao_code)
-        if metar_data:
-            weather_data['metar'] = metar_data
-            print(f"✅ METAR: {len(metar_data)} records")
-        else:
-            print("❌ METAR: No data")
-        
-        # Fetch TAF
-        taf_data = self.get_taf_data(icao_code)
-        if taf_data:
-            weather_data['taf'] = taf_data
-            print(f"✅ TAF: {len(taf_data)} records")
-        else:
-            print("❌ TAF: No data")
-        
-        # Fetch PIREP
-        pirep_data = self.get_pirep_data(icao_code)
-        if pirep_data:
-            weather_data['pirep'] = pirep_data
-            print(f"✅ PIREP: {len(pirep_data)} records")
-        else:
-            print("❌ PIREP: No data")
-        
-        # Fetch SIGMET
-        sigmet_data = self.get_sigmet_data(icao_code)
-        if sigmet_data:
-            weather_data['sigmet'] = sigmet_data
-            print(f"✅ SIGMET: {len(sigmet_data)} records")
-        else:
-            print("❌ SIGMET: No data")
-        
-        # Fetch AIRMET
-        airmet_data = self.get_airmet_data(icao_code)
-        if airmet_data:
-            weather_data['airmet'] = airmet_data
-            print(f"✅ AIRMET: {len(airmet_data)} records")
-        else:
-            print("❌ AIRMET: No data")
-        
+        results = [
+            ('metar', 'METAR', metar_data),
+            ('taf', 'TAF', taf_data),
+            ('pirep', 'PIREP', pirep_data),
+            ('sigmet', 'SIGMET', sigmet_data),
+            ('airmet', 'AIRMET', airmet_data),
+        ]
+        for key, label, data in results:
+            if data:
+                weather_data[key] = data
+                self._log(f"✅ {label}: {len(data)} records")
+            else:
+                self._log(f"❌ {label}: No data")
+
         # Format comprehensive summary
         weather_summary = self.format_weather_summary(icao_code, weather_data)
         
-        print(f"\n{'='*60}")
-        print(f"📊 WEATHER SUMMARY GENERATED")
-        print(f"Data sources: {', '.join(weather_summary['data_sources'])}")
-        print(f"{'='*60}")
-        
+        self._log(f"\n{'='*60}")
+        self._log(f"📊 WEATHER SUMMARY GENERATED")
+        self._log(f"Data sources: {', '.join(weather_summary['data_sources'])}")
+        self._log(f"{'='*60}")
+
+        self._flush_log()
         return weather_summary
 
-def main():
+async def main():
     """Main interactive function"""
     tester = AviationWeatherTester()
-    
+
     print("🌤️  Aviation Weather API Tester")
     print("Fetches comprehensive weather data from aviationweather.gov")
     print("-" * 60)
-    
-    while True:
-        try:
-            # Get ICAO code from user
-            icao_code = input("\n✈️  Enter ICAO airport code (or 'quit' to exit): ").strip()
-            
-            if icao_code.lower() in ['quit', 'exit', 'q']:
-                print("👋 Goodbye!")
+
+    # One client for the whole interactive session, so consecutive airports
+    # reuse the same kept-alive TLS connection to aviationweather.gov
+    async with tester.make_client() as client:
+        while True:
+            try:
+                # Get ICAO code from user
+                icao_code = input("\n✈️  Enter ICAO airport code (or 'quit' to exit): ").strip()
+
+                if icao_code.lower() in ['quit', 'exit', 'q']:
+                    print("👋 Goodbye!")
+                    break
+
+                if not icao_code:
+                    continue
+
+                # Test the weather API
+                weather_data = await tester.test_airport_weather(client, icao_code)
+
+                # Pretty print the results
+                print(f"\n{'='*60}")
+                print(f"🎯 PRETTIFIED JSON OUTPUT FOR {icao_code}")
+                print(f"{'='*60}")
+
+                # orjson writes indented UTF-8 bytes directly; going through
+                # sys.stdout.buffer skips the str round-trip entirely
+                sys.stdout.buffer.write(
+                    orjson.dumps(weather_data, option=orjson.OPT_INDENT_2, default=str) + b'\n'
+                )
+
+                # Ask if user wants to save to file
+                save = input(f"\n💾 Save results to file? (y/n): ").strip().lower()
+                if save in ['y', 'yes']:
+                    filename = f"weather_{icao_code}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                    try:
+                        with open(filename, 'wb') as f:
+                            f.write(orjson.dumps(weather_data, option=orjson.OPT_INDENT_2, default=str))
+                        print(f"✅ Results saved to {filename}")
+                    except Exception as e:
+                        print(f"❌ Error saving file: {e}")
+
+            except ValueError as e:
+                print(f"❌ Invalid input: {e}")
+            except KeyboardInterrupt:
+                print("\n👋 Goodbye!")
                 break
-            
-            if not icao_code:
-                continue
-            
-            # Test the weather API
-            weather_data = tester.test_airport_weather(icao_code)
-            
-            # Pretty print the results
-            print(f"\n{'='*60}")
-            print(f"🎯 PRETTIFIED JSON OUTPUT FOR {icao_code}")
-            print(f"{'='*60}")
-            
-            print(json.dumps(weather_data, indent=2, ensure_ascii=False, default=str))
-            
-            # Ask if user wants to save to file
-            save = input(f"\n💾 Save results to file? (y/n): ").strip().lower()
-            if save in ['y', 'yes']:
-                filename = f"weather_{icao_code}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            except Exception as e:
+                print(f"❌ Unexpected error: {e}")
+
+
+async def run_batch(icao_codes: List[str], concurrency: int) -> None:
+    """Test many airports concurrently and save one combined JSON file.
+
+    A semaphore bounds the in-flight airports so a long list does not
+    open unbounded work at once; each airport gets its own tester (and
+    output buffer) while all share one pooled client.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AviationWeatherTester().make_client() as client:
+        async def test_one(icao_code: str) -> Optional[Dict]:
+            async with semaphore:
                 try:
-                    with open(filename, 'w') as f:
-                        json.dump(weather_data, f, indent=2, ensure_ascii=False, default=str)
-                    print(f"✅ Results saved to {filename}")
-                except Exception as e:
-                    print(f"❌ Error saving file: {e}")
-        
-        except ValueError as e:
-            print(f"❌ Invalid input: {e}")
-        except KeyboardInterrupt:
-            print("\n👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+                    return await AviationWeatherTester().test_airport_weather(client, icao_code)
+                except ValueError as e:
+                    print(f"❌ {icao_code}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(test_one(icao) for icao in icao_codes))
+
+    summaries = [r for r in results if r]
+    filename = f"weather_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(summaries, option=orjson.OPT_INDENT_2, default=str))
+    print(f"\n✅ {len(summaries)}/{len(icao_codes)} airports saved to {filename}")
+
+
+async def run_route(icao_codes: List[str]) -> None:
+    """Test a whole route with the batched ID-keyed fetchers.
+
+    Unlike run_batch (independent airports, one full test each), this
+    goes through test_route_weather: one METAR request, one TAF request
+    and one union-bbox SIGMET request for the entire route.
+    """
+    tester = AviationWeatherTester()
+    async with tester.make_client() as client:
+        route_weather = await tester.test_route_weather(client, icao_codes)
+
+    sys.stdout.buffer.write(
+        orjson.dumps(route_weather, option=orjson.OPT_INDENT_2, default=str) + b'\n'
+    )
+    filename = f"weather_route_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(route_weather, option=orjson.OPT_INDENT_2, default=str))
+    print(f"\n✅ Route weather for {' -> '.join(route_weather['airports'])} saved to {filename}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Test aviationweather.gov endpoints interactively or in batch mode"
+    )
+    parser.add_argument('--batch', metavar='PATH',
+                        help="file with one ICAO code per line; runs non-interactively")
+    parser.add_argument('--route', metavar='ICAOS',
+                        help="comma-separated ICAO codes tested as one route "
+                             "with batched METAR/TAF and a union-bbox SIGMET")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="maximum airports in flight in batch mode (default: 8)")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = _parse_args()
+    if args.batch:
+        with open(args.batch) as f:
+            codes = [line.strip().upper() for line in f if line.strip()]
+        asyncio.run(run_batch(codes, args.concurrency))
+    elif args.route:
+        asyncio.run(run_route([c for c in args.route.split(',') if c.strip()]))
+    else:
+        asyncio.run(main())
\ No newline at end of file